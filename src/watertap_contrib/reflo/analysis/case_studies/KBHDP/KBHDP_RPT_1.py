@@ -18,7 +18,6 @@ from idaes.core import FlowsheetBlock, MaterialFlowBasis
 from idaes.core.util.initialization import propagate_state as _prop_state
 from idaes.core.solvers import get_solver
 import idaes.core.util.scaling as iscale
-from watertap_contrib.reflo.core import REFLODatabase
 import idaes.logger as idaeslog
 from watertap.property_models.NaCl_prop_pack import NaClParameterBlock
 from watertap.property_models.multicomp_aq_sol_prop_pack import MCASParameterBlock
@@ -118,7 +117,7 @@ def build_sweep(
 
 def build_system(RE=True):
     m = ConcreteModel()
-    m.db = REFLODatabase()
+    m.db = get_reflo_db()
     m.fs = FlowsheetBlock(dynamic=False)
 
     m.fs.MCAS_properties = MCASParameterBlock(
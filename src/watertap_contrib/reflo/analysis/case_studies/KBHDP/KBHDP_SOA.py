@@ -28,7 +28,6 @@ from idaes.core.util.model_statistics import *
 from idaes.core import FlowsheetBlock, UnitModelCostingBlock
 from idaes.models.unit_models import Product, Feed, StateJunction, Separator
 
-from watertap_contrib.reflo.core import REFLODatabase
 from watertap.core.util.model_diagnostics.infeasible import *
 from watertap.core.util.initialization import *
 from watertap.property_models.NaCl_prop_pack import NaClParameterBlock
@@ -90,7 +89,7 @@ def main():
 
 def build_system():
     m = ConcreteModel()
-    m.db = REFLODatabase()
+    m.db = get_reflo_db()
     m.fs = FlowsheetBlock(dynamic=False)
 
     m.fs.MCAS_properties = MCASParameterBlock(
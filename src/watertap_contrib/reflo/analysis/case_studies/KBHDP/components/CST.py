@@ -123,26 +123,16 @@ def calc_costing(m, blk):
 
 def report_cst(m, blk):
     # blk = m.fs.cst
-    print(f"\n\n-------------------- CST Report --------------------\n")
-    print("\n")
-
-    print(
-        f'{"Heat load":<30s}{value(blk.heat_load):<20,.2f}{pyunits.get_units(blk.heat_load)}'
-    )
-
-    print(
-        f'{"Heat annual":<30s}{value(blk.heat_annual):<20,.2f}{pyunits.get_units(blk.heat_annual)}'
-    )
-
-    print(f'{"Heat":<30s}{value(blk.heat):<20,.2f}{pyunits.get_units(blk.heat)}')
-
-    print(
-        f'{"Electricity annual":<30s}{value(blk.electricity_annual):<20,.2f}{pyunits.get_units(blk.electricity_annual)}'
-    )
-
-    print(
-        f'{"Electricity":<30s}{value(blk.electricity):<20,.2f}{pyunits.get_units(blk.electricity)}'
-    )
+    rows = [f"\n\n-------------------- CST Report --------------------\n", "\n"]
+    for label, v in [
+        ("Heat load", blk.heat_load),
+        ("Heat annual", blk.heat_annual),
+        ("Heat", blk.heat),
+        ("Electricity annual", blk.electricity_annual),
+        ("Electricity", blk.electricity),
+    ]:
+        rows.append(f"{label:<30s}{value(v):<20,.2f}{pyunits.get_units(v)}")
+    print("\n".join(rows))
 
 
 def report_cst_costing(m, blk):
@@ -192,7 +182,6 @@ def report_cst_costing(m, blk):
 
 if __name__ == "__main__":
 
-    solver = get_solver()
     solver = SolverFactory("ipopt")
 
     m = build_system()
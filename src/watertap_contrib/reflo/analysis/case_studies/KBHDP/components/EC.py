@@ -16,10 +16,12 @@ from pyomo.environ import (
     units as pyunits,
 )
 from pyomo.util.calc_var_value import calculate_variable_from_constraint as cvc
+from pyomo.core.expr.calculus.derivatives import differentiate
+from pyomo.core.expr.visitor import identify_variables
+import idaes.logger as idaeslog
 from idaes.core import FlowsheetBlock, UnitModelCostingBlock
 from idaes.core.solvers import get_solver
 
-from watertap_contrib.reflo.core import REFLODatabase
 from watertap.core.zero_order_properties import (
     WaterParameterBlock as WaterParameterBlockZO,
 )
@@ -34,14 +36,12 @@ from idaes.core.util.scaling import *
 from watertap.core.util.model_diagnostics.infeasible import *
 from watertap.core.util.initialization import *
 from idaes.core.util.constants import Constants
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
 from watertap.costing import WaterTAPCosting
 import math
 from watertap_contrib.reflo.analysis.case_studies.KBHDP.utils import (
     check_jac,
     calc_scale,
+    get_reflo_db,
 )
 
 __all__ = [
@@ -64,6 +64,11 @@ __all__ = [
     "print_EC_costing_breakdown",
 ]
 
+_log = idaeslog.getLogger(__name__)
+
+# Feed mass flow (kg/s) for the EC flowsheet; kg/m3 * m3/s = kg/s
+EC_FEED_FLOW_MASS_COMP = {"H2O": 175.25054, "tds": 2.143156, "tss": 5.22e-6}
+
 
 def propagate_state(arc, detailed=True):
     _prop_state(arc)
@@ -98,7 +103,7 @@ def _initialize(blk, verbose=False):
 def build_system():
     """Function to create concrete model for individual unit model flowsheet"""
     m = ConcreteModel()
-    m.db = REFLODatabase()
+    m.db = get_reflo_db()
 
     m.fs = FlowsheetBlock(dynamic=False)
     m.fs.properties = WaterParameterBlock(solute_list=["tds", "tss"])
@@ -159,22 +164,21 @@ def build_ec(m, blk, prop_package=None):
         destination=blk.disposal.inlet,
     )
 
-    TransformationFactory("network.expand_arcs").apply_to(m)
-
 
 def set_system_operating_conditions(m):
     """This function sets the system operating conditions for individual unit model flowsheet"""
 
-    m.fs.feed.properties[0].flow_mass_comp["H2O"].fix(175.25054)
-    m.fs.feed.properties[0].flow_mass_comp["tds"].fix(2.143156)  # kg/m3 * m3/s = kg/s
-    m.fs.feed.properties[0.0].flow_mass_comp["tss"].fix(5.22e-6)
+    flow_mass_comp = m.fs.feed.properties[0].flow_mass_comp
+    for j, flow in EC_FEED_FLOW_MASS_COMP.items():
+        flow_mass_comp[j].fix(flow)
     # # initialize feed
 
 
 def set_ec_operating_conditions(m, blk, conv=5e3):
     """Set EC operating conditions"""
     # Check if the set up of the ec inputs is correct
-    print(f"EC Degrees of Freedom: {degrees_of_freedom(blk.ec)}")
+    if _log.isEnabledFor(idaeslog.DEBUG):
+        _log.debug(f"EC Degrees of Freedom: {degrees_of_freedom(blk.ec)}")
 
     blk.ec.load_parameters_from_database(use_default_removal=True)
     # blk.ec.conductivity.unfix()
@@ -188,7 +192,8 @@ def set_ec_operating_conditions(m, blk, conv=5e3):
     # )
     # blk.feed.properties[0.0].flow_mass_comp["tss"].fix(5.22e-6)
     # blk.ec.overpotential.fix(2)
-    print(f"EC Degrees of Freedom: {degrees_of_freedom(blk.ec)}")
+    if _log.isEnabledFor(idaeslog.DEBUG):
+        _log.debug(f"EC Degrees of Freedom: {degrees_of_freedom(blk.ec)}")
 
 
 def set_scaling(m, blk):
@@ -196,18 +201,53 @@ def set_scaling(m, blk):
     def calc_scale(value):
         return math.floor(math.log(value, 10))
 
-    scale_flow = calc_scale(m.fs.feed.flow_mass_comp[0, "H2O"].value)
-    scale_tds = calc_scale(m.fs.feed.flow_mass_comp[0, "tds"].value)
-    scale_tss = calc_scale(m.fs.feed.flow_mass_comp[0, "tss"].value)
-
-    m.fs.properties.set_default_scaling(
-        "flow_mass_comp", 10**-scale_flow, index=("H2O")
-    )
-    m.fs.properties.set_default_scaling("flow_mass_comp", 10**-scale_tds, index=("tds"))
-    m.fs.properties.set_default_scaling("flow_mass_comp", 10**-scale_tss, index=("tss"))
+    feed_flow_mass_comp = m.fs.feed.flow_mass_comp
+    set_default_scaling = m.fs.properties.set_default_scaling
+    for j in m.fs.properties.component_list:
+        scale = calc_scale(feed_flow_mass_comp[0, j].value)
+        set_default_scaling("flow_mass_comp", 10**-scale, index=j)
     calculate_scaling_factors(m)
 
 
+def add_ec_row_scaling(blk, max_bound_ratio=1e9, max_coef_ratio=1e9):
+    """
+    Scale EC variables with wide bounds to their nominal magnitude, then scale
+    each active equality on the EC unit by the geometric mean of its Jacobian entries.
+    The Jacobian is evaluated at the current point, so call this after the system
+    is initialized.
+    """
+    for v in blk.ec.component_data_objects(Var, descend_into=True):
+        if v.fixed or not v.value or get_scaling_factor(v) is not None:
+            continue
+        lb, ub = v.bounds
+        if lb is None or ub is None or min(abs(lb), abs(ub)) == 0:
+            continue
+        if max(abs(lb), abs(ub)) / min(abs(lb), abs(ub)) > max_bound_ratio:
+            set_scaling_factor(v, 10 ** -round(math.log10(abs(v.value))))
+
+    for c in blk.ec.component_data_objects(Constraint, active=True, descend_into=True):
+        if not c.equality:
+            continue
+        body_vars = list(identify_variables(c.body))
+        if any(v.value is None for v in body_vars):
+            continue
+        unfixed_vars = [v for v in body_vars if not v.fixed]
+        if not unfixed_vars:
+            continue
+        derivs = differentiate(
+            c.body, wrt_list=unfixed_vars, mode=differentiate.Modes.reverse_numeric
+        )
+        coefs = [abs(d) for d in derivs if d != 0]
+        if not coefs:
+            continue
+        geo_mean = math.exp(sum(math.log(d) for d in coefs) / len(coefs))
+        constraint_scaling_transform(c, 1 / geo_mean, overwrite=False)
+        if max(coefs) / min(coefs) > max_coef_ratio:
+            _log.warning(
+                f"Coefficient range of {c.name} spans more than {max_coef_ratio:.0e} after scaling."
+            )
+
+
 def add_ec_scaling(m, blk):
     set_scaling_factor(blk.ec.charge_loading_rate, 1e1)
     set_scaling_factor(blk.ec.electrode_volume, 1)
@@ -239,7 +279,7 @@ def init_system(m, solver=None):
     m.fs.feed.initialize(optarg=optarg)
     propagate_state(m.fs.feed_to_unit)
 
-    init_ec(m, m.fs.EC)
+    init_ec(m, m.fs.EC, solver=solver)
 
 
 def init_ec(m, blk, solver=None):
@@ -407,12 +447,14 @@ if __name__ == "__main__":
     set_ec_operating_conditions(m, m.fs.EC)
     add_ec_scaling(m, m.fs.EC)
     set_scaling(m, m.fs.EC)
-    init_system(m)
+    solver = get_solver()
+    init_system(m, solver=solver)
+    add_ec_row_scaling(m.fs.EC)
     add_system_costing(m)
 
-    solver = get_solver()
     m.fs.objective_lcow = Objective(expr=m.fs.costing.LCOW)
-    results = solve(m, debug=True)
+    solver.options["max_iter"] = 2000
+    results = solve(m, solver=solver, debug=True)
 
     report_EC(m.fs.EC)
     print_EC_costing_breakdown(m.fs.EC)
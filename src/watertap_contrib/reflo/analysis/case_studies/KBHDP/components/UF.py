@@ -1,6 +1,4 @@
 import os
-import math
-import numpy as np
 from pyomo.environ import (
     ConcreteModel,
     value,
@@ -19,7 +17,7 @@ from pyomo.environ import (
 )
 from pyomo.network import Arc, SequentialDecomposition
 from pyomo.util.check_units import assert_units_consistent
-from idaes.core import FlowsheetBlock, UnitModelCostingBlock, MaterialFlowBasis
+from idaes.core import FlowsheetBlock, UnitModelCostingBlock
 from idaes.core.solvers import get_solver
 from idaes.core.util.initialization import propagate_state as _prop_state
 import idaes.core.util.scaling as iscale
@@ -34,8 +32,6 @@ from idaes.models.unit_models import Product, Feed, StateJunction, Separator
 from idaes.core.util.model_statistics import *
 from watertap.core.util.initialization import *
 from watertap.core.util.model_diagnostics.infeasible import *
-from watertap.property_models.NaCl_prop_pack import NaClParameterBlock
-from watertap.property_models.multicomp_aq_sol_prop_pack import MCASParameterBlock
 from watertap.core.zero_order_properties import WaterParameterBlock
 from watertap.unit_models.zero_order.ultra_filtration_zo import UltraFiltrationZO
 from watertap_contrib.reflo.costing import (
@@ -56,6 +52,12 @@ __all__ = [
     "print_UF_costing_breakdown",
 ]
 
+_log = idaeslogger.getLogger(__name__)
+
+# Feed mass flow (kg/s) and removal fractions used by the UF flowsheet
+UF_FEED_FLOW_MASS_COMP = {"H2O": 171.37, "tds": 1.96, "tss": 5.22e-6}
+UF_REMOVAL_FRAC_MASS_COMP = {(0, "tds"): 1e-3, (0, "tss"): 0.9}
+
 
 def propagate_state(arc):
     _prop_state(arc)
@@ -99,8 +101,8 @@ def init_UF(m, blk, verbose=True, solver=None):
         "\n\n-------------------- INITIALIZING ULTRAFILTRATION --------------------\n\n"
     )
     # print(f"System Degrees of Freedom: {degrees_of_freedom(m)}")
-    print(f"UF Degrees of Freedom: {degrees_of_freedom(blk)}")
-    print("\n\n")
+    if _log.isEnabledFor(idaeslogger.DEBUG):
+        _log.debug(f"UF Degrees of Freedom: {degrees_of_freedom(blk)}")
     # assert_no_degrees_of_freedom(m)
     blk.feed.initialize(optarg=optarg)
     propagate_state(blk.feed_to_unit)
@@ -113,17 +115,20 @@ def init_UF(m, blk, verbose=True, solver=None):
 
 def set_UF_op_conditions(blk):
     # blk.feed.properties[0.0].flow_mass_comp["tss"].fix(5.22e-6)
-    print(f"UF Degrees of Freedom: {degrees_of_freedom(blk)}")
-    blk.unit.recovery_frac_mass_H2O.fix(0.99)
-    blk.unit.removal_frac_mass_comp[0, "tds"].fix(1e-3)
-    blk.unit.removal_frac_mass_comp[0, "tss"].fix(0.9)
-    blk.unit.energy_electric_flow_vol_inlet.fix(0.05)
+    if _log.isEnabledFor(idaeslogger.DEBUG):
+        _log.debug(f"UF Degrees of Freedom: {degrees_of_freedom(blk)}")
+    unit = blk.unit
+    unit.recovery_frac_mass_H2O.fix(0.99)
+    removal_frac_mass_comp = unit.removal_frac_mass_comp
+    for (t, j), frac in UF_REMOVAL_FRAC_MASS_COMP.items():
+        removal_frac_mass_comp[t, j].fix(frac)
+    unit.energy_electric_flow_vol_inlet.fix(0.05)
 
 
 def set_system_conditions(blk):
-    blk.feed.properties[0.0].flow_mass_comp["H2O"].fix(171.37)
-    blk.feed.properties[0.0].flow_mass_comp["tds"].fix(1.96)
-    blk.feed.properties[0.0].flow_mass_comp["tss"].fix(5.22e-6)
+    flow_mass_comp = blk.feed.properties[0.0].flow_mass_comp
+    for j, flow in UF_FEED_FLOW_MASS_COMP.items():
+        flow_mass_comp[j].fix(flow)
 
 
 def add_UF_costing(m, blk, costing_blk=None):
@@ -158,20 +163,6 @@ def build_system():
     m.fs.costing = REFLOCosting()
     # m.fs.costing = ZeroOrderCosting()
     m.db = Database()
-    m.fs.RO_properties = NaClParameterBlock()
-    m.fs.MCAS_properties = MCASParameterBlock(
-        solute_list=[
-            "Alkalinity_2-",
-            "Ca_2+",
-            "Cl_-",
-            "Mg_2+",
-            "K_+",
-            "SiO2",
-            "Na_+",
-            "SO2_-4+",
-        ],
-        material_flow_basis=MaterialFlowBasis.mass,
-    )
     m.fs.params = WaterParameterBlock(solute_list=["tds", "tss"])
 
     m.fs.UF = FlowsheetBlock(dynamic=False)
@@ -204,60 +195,37 @@ def solve(model, solver=None, tee=True, raise_on_failure=True):
 
 
 def print_stream_table(blk):
-    print(f'{"FEED":<20s}')
-    print(
-        f'{"    H2O":<20s}{m.fs.UF.feed.properties[0.0].flow_mass_comp["H2O"].value:<10.3f}{pyunits.get_units(m.fs.UF.feed.properties[0.0].flow_mass_comp["H2O"])}'
-    )
-    print(
-        f'{"    TDS":<20s}{m.fs.UF.feed.properties[0.0].flow_mass_comp["tds"].value:<10.3f}{pyunits.get_units(m.fs.UF.feed.properties[0.0].flow_mass_comp["tds"])}'
-    )
-    print(
-        f'{"    TSS":<20s}{m.fs.UF.feed.properties[0.0].flow_mass_comp["tss"].value:<10.3f}{pyunits.get_units(m.fs.UF.feed.properties[0.0].flow_mass_comp["tss"])}'
-    )
-    print(f'{"PRODUCT":<20s}')
-    print(
-        f'{"    H2O":<20s}{m.fs.UF.product.properties[0.0].flow_mass_comp["H2O"].value:<10.3f}{pyunits.get_units(m.fs.UF.product.properties[0.0].flow_mass_comp["H2O"])}'
-    )
-    print(
-        f'{"    TDS":<20s}{m.fs.UF.product.properties[0.0].flow_mass_comp["tds"].value:<10.3f}{pyunits.get_units(m.fs.UF.product.properties[0.0].flow_mass_comp["tds"])}'
-    )
-    print(
-        f'{"    TSS":<20s}{m.fs.UF.product.properties[0.0].flow_mass_comp["tss"].value:<10.3f}{pyunits.get_units(m.fs.UF.product.properties[0.0].flow_mass_comp["tss"])}'
-    )
-    print(f'{"DISPOSAL":<20s}')
-    print(
-        f'{"    H2O":<20s}{m.fs.UF.disposal.properties[0.0].flow_mass_comp["H2O"].value:<10.3f}{pyunits.get_units(m.fs.UF.disposal.properties[0.0].flow_mass_comp["H2O"])}'
-    )
-    print(
-        f'{"    TDS":<20s}{m.fs.UF.disposal.properties[0.0].flow_mass_comp["tds"].value:<10.3f}{pyunits.get_units(m.fs.UF.disposal.properties[0.0].flow_mass_comp["tds"])}'
-    )
-    print(
-        f'{"    TSS":<20s}{m.fs.UF.disposal.properties[0.0].flow_mass_comp["tss"].value:<10.3f}{pyunits.get_units(m.fs.UF.disposal.properties[0.0].flow_mass_comp["tss"])}'
-    )
+    rows = []
+    for label, stream in [
+        ("FEED", blk.feed),
+        ("PRODUCT", blk.product),
+        ("DISPOSAL", blk.disposal),
+    ]:
+        flow_mass_comp = stream.properties[0.0].flow_mass_comp
+        rows.append(f"{label:<20s}")
+        for j in ["H2O", "tds", "tss"]:
+            flow = flow_mass_comp[j]
+            rows.append(
+                f"{'    ' + j.upper():<20s}{flow.value:<10.3f}{pyunits.get_units(flow)}"
+            )
+    print("\n".join(rows))
 
 
 def report_UF(m, blk, stream_table=False):
-    print(f"\n\n-------------------- UF Report --------------------\n")
-    print("\n")
-    print(
-        f'{"Inlet Flow Volume":<30s}{value(blk.feed.properties[0.0].flow_vol):<10.3f}{pyunits.get_units(blk.feed.properties[0.0].flow_vol)}'
-    )
-    print(f'{"UF Performance:":<30s}')
-    print(
-        f'{"    Recovery":<30s}{100*blk.unit.recovery_frac_mass_H2O[0.0].value:<10.1f}{"%"}'
-    )
-    print(
-        f'{"    TDS Removal":<30s}{100*blk.unit.removal_frac_mass_comp[0.0,"tds"].value:<10.1f}{"%"}'
-    )
-    print(
-        f'{"    TSS Removal":<30s}{100*blk.unit.removal_frac_mass_comp[0.0,"tss"].value:<10.1f}{"%"}'
-    )
-    print(
-        f'{"    Energy Consumption":<30s}{blk.unit.electricity[0.0].value:<10.3f}{pyunits.get_units(blk.unit.electricity[0.0])}'
-    )
-    print(
-        f'{"    Specific Energy Cons.":<30s}{value(blk.unit.energy_electric_flow_vol_inlet):<10.3f}{pyunits.get_units(blk.unit.energy_electric_flow_vol_inlet)}'
-    )
+    feed = blk.feed.properties[0.0]
+    unit = blk.unit
+    rows = [
+        f"\n\n-------------------- UF Report --------------------\n",
+        "\n",
+        f'{"Inlet Flow Volume":<30s}{value(feed.flow_vol):<10.3f}{pyunits.get_units(feed.flow_vol)}',
+        f'{"UF Performance:":<30s}',
+        f'{"    Recovery":<30s}{100*unit.recovery_frac_mass_H2O[0.0].value:<10.1f}{"%"}',
+        f'{"    TDS Removal":<30s}{100*unit.removal_frac_mass_comp[0.0,"tds"].value:<10.1f}{"%"}',
+        f'{"    TSS Removal":<30s}{100*unit.removal_frac_mass_comp[0.0,"tss"].value:<10.1f}{"%"}',
+        f'{"    Energy Consumption":<30s}{unit.electricity[0.0].value:<10.3f}{pyunits.get_units(unit.electricity[0.0])}',
+        f'{"    Specific Energy Cons.":<30s}{value(unit.energy_electric_flow_vol_inlet):<10.3f}{pyunits.get_units(unit.energy_electric_flow_vol_inlet)}',
+    ]
+    print("\n".join(rows))
 
 
 def print_UF_costing_breakdown(blk, debug=False):
@@ -314,8 +282,9 @@ if __name__ == "__main__":
     add_UF_costing(m, m.fs.UF)
     m.fs.costing.cost_process()
     # m.fs.costing.initialize()
-    init_UF(m, m.fs.UF)
-    solve(m)
+    solver = get_solver()
+    init_UF(m, m.fs.UF, solver=solver)
+    solve(m, solver=solver)
 
     report_UF(m, m.fs.UF)
     m.fs.UF.unit.costing.display()
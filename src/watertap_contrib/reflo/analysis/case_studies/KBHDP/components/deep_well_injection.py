@@ -87,12 +87,13 @@ def set_system_op_conditions(blk):
         "Alkalinity_2-": 0.421,
     }
 
-    rho = 1000 * pyunits.kg / pyunits.m**3
-    flow_mgd = 5.08 * pyunits.Mgallons / pyunits.day
-
-    flow_mass_phase_water = pyunits.convert(
-        flow_mgd * rho, to_units=pyunits.kg / pyunits.s
+    # Plain numeric conversions; concentrations are kg/m3 and rho is 1000 kg/m3
+    flow_vol = 5.08 * pyunits.convert_value(
+        1,
+        from_units=pyunits.Mgallons / pyunits.day,
+        to_units=pyunits.m**3 / pyunits.s,
     )
+    flow_mass_phase_water = 1000 * flow_vol
 
     prop = blk.unit.properties[0]
     prop.temperature.fix()
@@ -100,19 +101,16 @@ def set_system_op_conditions(blk):
 
     prop.flow_mass_phase_comp["Liq", "H2O"].fix(flow_mass_phase_water)
     for solute, conc in inlet_conc.items():
-        mass_flow_solute = pyunits.convert(
-            flow_mgd * conc * pyunits.kg / pyunits.m**3,
-            to_units=pyunits.kg / pyunits.s,
-        )
+        mass_flow_solute = flow_vol * conc
         prop.flow_mass_phase_comp["Liq", solute].fix(mass_flow_solute)
         prop.set_default_scaling(
             "flow_mass_phase_comp",
-            value(1 / mass_flow_solute),
+            1 / mass_flow_solute,
             index=("Liq", solute),
         )
     prop.set_default_scaling(
         "flow_mass_phase_comp",
-        value(1 / flow_mass_phase_water),
+        1 / flow_mass_phase_water,
         index=("Liq", "H2O"),
     )
 
@@ -58,7 +58,6 @@ __all__ = [
     "init_softener",
     "print_softening_costing_breakdown",
 ]
-rho = 1000 * pyunits.kg / pyunits.m**3
 
 
 def propagate_state(arc):
@@ -143,10 +142,10 @@ def set_system_operating_conditions(
     soft = m.fs.softener.unit
     prop_in = soft.properties_in[0]
     prop_out = soft.properties_out[0]
-    Qin = Qin * pyunits.Mgal / pyunits.day
-    flow_in = pyunits.convert(Qin, to_units=pyunits.m**3 / pyunits.s)
-
-    flow_mass_phase_water = pyunits.convert(Qin * rho, to_units=pyunits.kg / pyunits.s)
+    # Plain numeric conversions; no Pyomo expressions are needed to get floats
+    flow_in = Qin * pyunits.convert_value(
+        1, from_units=pyunits.Mgal / pyunits.day, to_units=pyunits.m**3 / pyunits.s
+    )
 
     inlet_dict = {
         "Ca_2+": 0.61 * pyunits.kg / pyunits.m**3,
@@ -159,17 +158,15 @@ def set_system_operating_conditions(
         "SO2_-4+": 0.23 * pyunits.kg / pyunits.m**3,
     }
     calc_state_dict = {
-        ("flow_vol_phase", "Liq"): value(flow_in),
+        ("flow_vol_phase", "Liq"): flow_in,
         ("pressure", None): 101325,
         ("temperature", None): 298,
     }
 
     for solute, solute_conc in inlet_dict.items():
         calc_state_dict[("conc_mass_phase_comp", ("Liq", solute))] = solute_conc
-        flow_mass_solute = pyunits.convert(
-            flow_in * solute_conc, to_units=pyunits.kg / pyunits.s
-        )
-        sf = 1 / value(flow_mass_solute)
+        flow_mass_solute = flow_in * value(solute_conc)
+        sf = 1 / flow_mass_solute
         m.fs.feed.properties[0].flow_mass_phase_comp["Liq", solute].set_value(
             flow_mass_solute
         )
@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 import idaes.core.util.scaling as iscale
 from pyomo.environ import (
     Var,
@@ -11,7 +12,25 @@ import time
 from watertap.core.util.model_diagnostics.infeasible import *
 import numpy as np
 
-__all__ = ["check_jac", "calc_scale", "print_fixed_and_unfixed_vars", "breakdown_dof"]
+from watertap_contrib.reflo.core import REFLODatabase
+
+__all__ = [
+    "check_jac",
+    "calc_scale",
+    "print_fixed_and_unfixed_vars",
+    "breakdown_dof",
+    "get_reflo_db",
+]
+
+
+@lru_cache(maxsize=1)
+def get_reflo_db():
+    """
+    Return a REFLODatabase shared by every flowsheet build, so the YAML files
+    are only parsed once per session. Unit models deep copy the parameters
+    they read, so sharing the instance is safe.
+    """
+    return REFLODatabase()
 
 
 def check_jac(m, print_extreme_jacobian_values=True):
@@ -16,8 +16,8 @@ import numpy as np
 
 # Pyomo imports
 from pyomo.environ import (
-    Var,
     Constraint,
+    Expression,
     value,
     units as pyunits,
 )
@@ -33,7 +33,6 @@ from idaes.core import (
 from idaes.core.util.exceptions import (
     ConfigurationError,
 )
-import idaes.core.util.scaling as iscale
 import idaes.logger as idaeslog
 from idaes.apps.grid_integration.multiperiod.multiperiod import MultiPeriodModel
 
@@ -55,6 +54,27 @@ __author__ = "Zhuoran Zhang"
 # Set up logger
 _logger = idaeslog.getLogger(__name__)
 
+# Maximum brine salinity (g/L) covered by the surrogate of each module type
+_max_allowed_brine_salinity = {"AS7C1.5L": 292.2, "AS26C7.2L": 245.5}
+
+# Valid ranges of the numeric model inputs, in the order they are checked.
+# An upper bound of None is the maximum allowed brine salinity of the module.
+_input_ranges = (
+    ("system_capacity", 0, float("inf")),
+    ("feed_flow_rate", 400, 1100),
+    ("evap_inlet_temp", 60, 80),
+    ("cond_inlet_temp", 20, 30),
+    ("feed_temp", 20, 30),
+    ("feed_salinity", 35, None),
+    ("initial_batch_volume", 50, float("inf")),
+    ("recovery_ratio", 0, 1),
+)
+
+# Feed flow rate conversion (L/h to m3/s) applied whenever the feed flow is fixed
+_L_per_h_to_m3_per_s = pyunits.convert_value(
+    1, from_units=pyunits.L / pyunits.h, to_units=pyunits.m**3 / pyunits.s
+)
+
 
 def get_vagmd_batch_variable_pairs(t1, t2):
     """
@@ -67,25 +87,21 @@ def get_vagmd_batch_variable_pairs(t1, t2):
     Returns:
         None
     """
+    vagmd = t1.fs.vagmd
+    feed_props = vagmd.feed_props[0]
     return [
-        (
-            t1.fs.vagmd.feed_props[0].conc_mass_phase_comp["Liq", "TDS"],
-            t2.fs.pre_feed_salinity,
-        ),
-        (t1.fs.vagmd.feed_props[0].temperature, t2.fs.pre_feed_temperature),
-        (t1.fs.vagmd.evaporator_out_props[0].temperature, t2.fs.pre_evap_out_temp),
-        (
-            t1.fs.vagmd.permeate_props[0].flow_vol_phase["Liq"],
-            t2.fs.pre_permeate_flow_rate,
-        ),
+        (feed_props.conc_mass_phase_comp["Liq", "TDS"], t2.fs.pre_feed_salinity),
+        (feed_props.temperature, t2.fs.pre_feed_temperature),
+        (vagmd.evaporator_out_props[0].temperature, t2.fs.pre_evap_out_temp),
+        (vagmd.permeate_props[0].flow_vol_phase["Liq"], t2.fs.pre_permeate_flow_rate),
         (t1.fs.acc_thermal_energy, t2.fs.pre_acc_thermal_energy),
         (t1.fs.acc_cooling_energy, t2.fs.pre_acc_cooling_energy),
         (t1.fs.acc_distillate_volume, t2.fs.pre_acc_distillate_volume),
         (t1.fs.acc_electric_energy, t2.fs.pre_acc_electric_energy),
-        (t1.fs.vagmd.thermal_power, t2.fs.pre_thermal_power),
-        (t1.fs.vagmd.cooling_power_thermal, t2.fs.pre_cooling_power),
-        (t1.fs.vagmd.feed_pump_power_elec, t2.fs.pre_feed_pump_power_elec),
-        (t1.fs.vagmd.cooling_pump_power_elec, t2.fs.pre_cooling_pump_power_elec),
+        (vagmd.thermal_power, t2.fs.pre_thermal_power),
+        (vagmd.cooling_power_thermal, t2.fs.pre_cooling_power),
+        (vagmd.feed_pump_power_elec, t2.fs.pre_feed_pump_power_elec),
+        (vagmd.cooling_pump_power_elec, t2.fs.pre_cooling_pump_power_elec),
     ]
 
 
@@ -115,9 +131,7 @@ def unfix_dof(m, feed_flow_rate):
     m.fs.vagmd.feed_props[0].flow_mass_phase_comp["Liq", "TDS"].unfix()
     m.fs.vagmd.feed_props[0].flow_mass_phase_comp["Liq", "H2O"].unfix()
     m.fs.vagmd.feed_props[0].flow_vol_phase["Liq"].fix(
-        pyunits.convert(
-            feed_flow_rate * pyunits.L / pyunits.h, to_units=pyunits.m**3 / pyunits.s
-        )
+        feed_flow_rate * _L_per_h_to_m3_per_s
     )
 
     return
@@ -194,50 +208,37 @@ class VAGMDbatchSurrogateData(UnitModelBlockData):
             cooling_inlet_temp=self.config.model_input["cooling_inlet_temp"],
         )
 
-        self.overall_thermal_power_requirement = Var(
-            initialize=2e5,
-            bounds=(0, None),
-            units=pyunits.kW,
-            doc="Thermal power requirement (kW-th)",
-        )
-
-        self.overall_elec_power_requirement = Var(
-            initialize=300,
-            bounds=(0, None),
-            units=pyunits.kW,
-            doc="Electric power requirement (kW-e)",
+        self.system_capacity_m3_per_h = Expression(
+            expr=pyunits.convert(
+                self.system_capacity, to_units=pyunits.m**3 / pyunits.h
+            ),
+            doc="System capacity (m3/h)",
         )
 
-        @self.Constraint(
-            doc="Calculate the overall thermal power requirement through all periods"
+        @self.Expression(
+            doc="Overall thermal power requirement through all periods (kW-th)"
         )
-        def eq_thermal_power_requirement(b):
-            return b.overall_thermal_power_requirement == (
+        def overall_thermal_power_requirement(b):
+            return pyunits.convert(
                 self.mp.get_active_process_blocks()[
                     -1
                 ].fs.specific_energy_consumption_thermal
-                * pyunits.convert(b.system_capacity, to_units=pyunits.m**3 / pyunits.h)
+                * b.system_capacity_m3_per_h,
+                to_units=pyunits.kW,
             )
 
-        @self.Constraint(
-            doc="Calculate the overall electric power requirement through all periods"
+        @self.Expression(
+            doc="Overall electric power requirement through all periods (kW-e)"
         )
-        def eq_elec_power_requirement(b):
-            return b.overall_elec_power_requirement == (
+        def overall_elec_power_requirement(b):
+            return pyunits.convert(
                 self.mp.get_active_process_blocks()[
                     -1
                 ].fs.specific_energy_consumption_electric
-                * pyunits.convert(b.system_capacity, to_units=pyunits.m**3 / pyunits.h)
+                * b.system_capacity_m3_per_h,
+                to_units=pyunits.kW,
             )
 
-        super().calculate_scaling_factors()
-
-        if iscale.get_scaling_factor(self.overall_thermal_power_requirement) is None:
-            iscale.set_scaling_factor(self.overall_thermal_power_requirement, 1e-5)
-
-        if iscale.get_scaling_factor(self.overall_elec_power_requirement) is None:
-            iscale.set_scaling_factor(self.overall_elec_power_requirement, 1e-3)
-
     def create_multiperiod_vagmd_batch_model(
         self,
         dt=None,
@@ -298,18 +299,7 @@ class VAGMDbatchSurrogateData(UnitModelBlockData):
                 f"In open circuit cooling system, the valid cooling water temperature is 20 - {feed_temp} deg C"
             )
 
-        max_allowed_brine_salinity = {"AS7C1.5L": 292.2, "AS26C7.2L": 245.5}
-        input_variables = [
-            "system_capacity",
-            "feed_flow_rate",
-            "evap_inlet_temp",
-            "cond_inlet_temp",
-            "feed_temp",
-            "feed_salinity",
-            "initial_batch_volume",
-            "recovery_ratio",
-        ]
-        input_values = [
+        input_values = (
             system_capacity,
             feed_flow_rate,
             evap_inlet_temp,
@@ -318,30 +308,19 @@ class VAGMDbatchSurrogateData(UnitModelBlockData):
             feed_salinity,
             initial_batch_volume,
             recovery_ratio,
-        ]
-        input_ranges = [
-            [0, float("inf")],
-            [400, 1100],
-            [60, 80],
-            [20, 30],
-            [20, 30],
-            [35, max_allowed_brine_salinity[module_type]],
-            [50, float("inf")],
-            [0, 1],
-        ]
-        for i in range(len(input_variables)):
-            if (
-                input_values[i] < input_ranges[i][0]
-                or input_values[i] > input_ranges[i][1]
-            ):
+        )
+        for (input_variable, lb, ub), input_value in zip(_input_ranges, input_values):
+            if ub is None:
+                ub = _max_allowed_brine_salinity[module_type]
+            if not lb <= input_value <= ub:
                 raise ConfigurationError(
-                    f"The input variable '{input_variables[i]}' is not valid."
-                    f"The valid range is {input_ranges[i][0]} - {input_ranges[i][1]}."
+                    f"The input variable '{input_variable}' is not valid."
+                    f"The valid range is {lb} - {ub}."
                 )
 
         final_brine_salinity = feed_salinity / (1 - recovery_ratio)  # g/L
         max_allowed_recovery_ratio = (
-            1 - feed_salinity / max_allowed_brine_salinity[module_type]
+            1 - feed_salinity / _max_allowed_brine_salinity[module_type]
         )
 
         if recovery_ratio > max_allowed_recovery_ratio:
@@ -355,10 +334,10 @@ class VAGMDbatchSurrogateData(UnitModelBlockData):
             cond_inlet_temp = 25
             evap_inlet_temp = 80
 
-        _logger.info(
-            f"For module AS7C1.5L, when the final brine salinity is larger than 175.3 g/L,"
-            f"the operational parameters will be fixed at nominal condition"
-        )
+            _logger.info(
+                f"For module AS7C1.5L, when the final brine salinity is larger than 175.3 g/L,"
+                f"the operational parameters will be fixed at nominal condition"
+            )
 
         # Calculate the number of periods to reach target recovery rate by solving the system first
         n_time_points = get_n_time_points(
@@ -399,7 +378,7 @@ class VAGMDbatchSurrogateData(UnitModelBlockData):
         }
 
         mp.build_multi_period_model(
-            model_data_kwargs={t: model_options for t in range(n_time_points)},
+            model_data_kwargs=dict.fromkeys(range(n_time_points), model_options),
             flowsheet_options=model_options,
             initialization_options={
                 "feed_temp": feed_temp,
@@ -420,20 +399,21 @@ class VAGMDbatchSurrogateData(UnitModelBlockData):
             unfix_dof(m=blk, feed_flow_rate=feed_flow_rate)
 
         # Set-up for the first time period
-        active_blks[0].fs.vagmd.feed_props[0].conc_mass_phase_comp["Liq", "TDS"].fix(
-            feed_salinity
-        )
-        active_blks[0].fs.vagmd.feed_props[0].temperature.fix(feed_temp + 273.15)
-        active_blks[0].fs.acc_distillate_volume.fix(0)
-        active_blks[0].fs.pre_feed_temperature.fix(feed_temp + 273.15)
-        active_blks[0].fs.pre_permeate_flow_rate.fix(0)
-        active_blks[0].fs.acc_thermal_energy.fix(0)
-        active_blks[0].fs.pre_thermal_power.fix(0)
-        active_blks[0].fs.acc_cooling_energy.fix(0)
-        active_blks[0].fs.pre_cooling_power.fix(0)
-        active_blks[0].fs.acc_electric_energy.fix(0)
-        active_blks[0].fs.pre_cooling_pump_power_elec.fix(0)
-        active_blks[0].fs.pre_feed_pump_power_elec.fix(0)
+        feed_temp_K = feed_temp + 273.15
+        fs0 = active_blks[0].fs
+        feed_props0 = fs0.vagmd.feed_props[0]
+        feed_props0.conc_mass_phase_comp["Liq", "TDS"].fix(feed_salinity)
+        feed_props0.temperature.fix(feed_temp_K)
+        fs0.acc_distillate_volume.fix(0)
+        fs0.pre_feed_temperature.fix(feed_temp_K)
+        fs0.pre_permeate_flow_rate.fix(0)
+        fs0.acc_thermal_energy.fix(0)
+        fs0.pre_thermal_power.fix(0)
+        fs0.acc_cooling_energy.fix(0)
+        fs0.pre_cooling_power.fix(0)
+        fs0.acc_electric_energy.fix(0)
+        fs0.pre_cooling_pump_power_elec.fix(0)
+        fs0.pre_feed_pump_power_elec.fix(0)
 
         return mp
 
@@ -503,59 +483,25 @@ class VAGMDbatchSurrogateData(UnitModelBlockData):
             ),
         }
 
-        time_period = [i for i in range(n_time_points)]
-        t_minutes = [value(blks[i].fs.dt) * i / 60 for i in range(n_time_points)]
-        feed_salinity = [
-            value(blks[i].fs.vagmd.feed_props[0].conc_mass_phase_comp["Liq", "TDS"])
-            for i in range(n_time_points)
-        ]
-        permeate_flux = [
-            value(blks[i].fs.vagmd.permeate_flux) for i in range(n_time_points)
-        ]
-        acc_distillate_volume = [
-            value(blks[i].fs.acc_distillate_volume) for i in range(n_time_points)
-        ]
-        feed_temp = [
-            value(blks[i].fs.vagmd.feed_props[0].temperature - 273.15)
-            for i in range(n_time_points)
-        ]
-        evap_out_temp = [
-            value(blks[i].fs.vagmd.evaporator_out_props[0].temperature - 273.15)
-            for i in range(n_time_points)
-        ]
-        cond_out_temp = [
-            value(blks[i].fs.vagmd.condenser_out_props[0].temperature - 273.15)
-            for i in range(n_time_points)
-        ]
-        recovery_ratio = [
-            value(blks[i].fs.acc_recovery_ratio) for i in range(n_time_points)
-        ]
-        STEC = [
-            value(blks[i].fs.specific_energy_consumption_thermal)
-            for i in range(n_time_points)
-        ]
-        SEEC = [
-            value(blks[i].fs.specific_energy_consumption_electric)
-            for i in range(n_time_points)
-        ]
-        GOR = [value(blks[i].fs.gain_output_ratio) for i in range(n_time_points)]
-
-        time_series = np.array(
-            [
-                time_period,
-                t_minutes,
-                feed_salinity,
-                permeate_flux,
-                acc_distillate_volume,
-                feed_temp,
-                evap_out_temp,
-                cond_out_temp,
-                recovery_ratio,
-                STEC,
-                SEEC,
-                GOR,
-            ]
-        )
+        time_series = np.empty((12, n_time_points), dtype=np.float64)
+        for i, blk in enumerate(blks):
+            fs = blk.fs
+            vagmd = fs.vagmd
+            feed_props = vagmd.feed_props[0]
+            time_series[:, i] = (
+                i,
+                value(fs.dt) * i / 60,
+                value(feed_props.conc_mass_phase_comp["Liq", "TDS"]),
+                value(vagmd.permeate_flux),
+                value(fs.acc_distillate_volume),
+                value(feed_props.temperature) - 273.15,
+                value(vagmd.evaporator_out_props[0].temperature) - 273.15,
+                value(vagmd.condenser_out_props[0].temperature) - 273.15,
+                value(fs.acc_recovery_ratio),
+                value(fs.specific_energy_consumption_thermal),
+                value(fs.specific_energy_consumption_electric),
+                value(fs.gain_output_ratio),
+            )
 
         data_table = pd.DataFrame(
             data=time_series,
@@ -17,6 +17,7 @@ import sys
 import numpy as np
 import pandas as pd
 from copy import deepcopy
+from functools import lru_cache
 from io import StringIO
 
 from pyomo.common.config import ConfigBlock, ConfigValue, In
@@ -36,6 +37,16 @@ from watertap.core.solvers import get_solver
 __author__ = "Kurban Sitterley"
 
 
+@lru_cache(maxsize=4)
+def _load_pysmo_surrogate(surrogate_file, mtime):
+    """
+    Load a PySMO surrogate from file. Keyed on the file modification time
+    so rewritten surrogate files are reloaded; the returned surrogate is shared
+    read-only between blocks built from the same file.
+    """
+    return PysmoSurrogate.load_from_file(surrogate_file)
+
+
 class SolarModelType(StrEnum):
     surrogate = "surrogate"
     physical = "physical"
@@ -388,7 +399,9 @@ class SolarEnergyBaseData(UnitModelBlockData):
         self.log.info("Loading surrogate.")
 
         self.surrogate_blk = SurrogateBlock(concrete=True)
-        self.surrogate = PysmoSurrogate.load_from_file(self.surrogate_file)
+        self.surrogate = _load_pysmo_surrogate(
+            self.surrogate_file, os.path.getmtime(self.surrogate_file)
+        )
         self.surrogate_blk.build_model(
             self.surrogate,
             input_vars=self.surrogate_inputs,
@@ -86,16 +86,8 @@ def cost_trough_surrogate(blk):
     make_variable_operating_cost_var(blk)
     make_fixed_operating_cost_var(blk)
 
-    blk.direct_cost = pyo.Var(
-        initialize=0,
-        units=blk.config.flowsheet_costing_block.base_currency,
-        bounds=(0, None),
-        doc="Direct cost of trough plant",
-    )
-
-    blk.direct_cost_constraint = pyo.Constraint(
-        expr=blk.direct_cost
-        == (
+    blk.direct_cost = pyo.Expression(
+        expr=(
             pyo.units.convert(trough.heat_load, to_units=pyo.units.kW)
             * (
                 trough_params.cost_per_capacity_capital
@@ -104,7 +96,8 @@ def cost_trough_surrogate(blk):
                 + trough.hours_storage * trough_params.cost_per_storage_capital
             )
         )
-        * (1 + trough_params.contingency_frac_direct_cost)
+        * (1 + trough_params.contingency_frac_direct_cost),
+        doc="Direct cost of trough plant",
     )
 
     blk.costing_package.add_cost_factor(blk, None)
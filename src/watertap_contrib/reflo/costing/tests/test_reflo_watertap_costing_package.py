@@ -1176,3 +1176,25 @@ def test_lazy_flow_costing():
         ),
     ):
         m.fs.costing.register_flow_type("baz", 42 * pyunits.USD_2020 / pyunits.m**2)
+
+
+@pytest.mark.component
+def test_case_study_definition():
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.costing1 = TreatmentCosting(case_study_definition="reflo.yaml")
+    m.fs.costing2 = TreatmentCosting(case_study_definition="reflo.yaml")
+
+    assert str(m.fs.costing1.base_currency) == "USD_2020"
+    assert m.fs.costing1.case_study_def == m.fs.costing2.case_study_def
+    # each block gets its own copy of the cached definition
+    assert m.fs.costing1.case_study_def is not m.fs.costing2.case_study_def
+
+    with pytest.raises(
+        OSError, match="Could not find specified case study definition file."
+    ):
+        m.fs.costing3 = TreatmentCosting(case_study_definition="not_a_case_study.yaml")
+
+    # definitions must provide defined_flows
+    with pytest.raises(KeyError, match="defined_flows"):
+        m.fs.costing4 = TreatmentCosting(case_study_definition="kbhdp_case_study.yaml")
@@ -30,6 +30,18 @@ from watertap_contrib.reflo.costing.util import (
 # Butterworth-Heinemann. https://doi.org/https://doi.org/10.1016/B978-0-08-096659-5.00007-9
 
 
+def _unit_conversion_factor(from_units, to_units):
+    """
+    Return the conversion between two units as a number carrying
+    units of to_units/from_units.
+    """
+    return (
+        pyo.units.convert_value(1, from_units=from_units, to_units=to_units)
+        * to_units
+        / from_units
+    )
+
+
 def build_air_stripping_cost_param_block(blk):
 
     blk.capital_cost_tower_A_param = pyo.Var(
@@ -256,93 +268,126 @@ def cost_air_stripping(blk):
     packing_material = ax.config.packing_material
     prop_in = ax.process_flow.properties_in[0]
     ax_params = blk.costing_package.air_stripping
-    tower_height_ft = pyo.units.convert(ax.tower_height, to_units=pyo.units.feet)
-    tower_diam_in = pyo.units.convert(ax.tower_diam, to_units=pyo.units.inch)
-    flow_vol_air = pyo.units.convert(
-        pyo.units.convert(
-            prop_in.flow_vol_phase["Vap"],
-            to_units=pyo.units.m**3 / pyo.units.hr,
+    # Correlations use feet and inches; the tower dimensions are in meters.
+    # Scaling by a precomputed factor avoids walking the tower expressions
+    # for their units as pyo.units.convert would.
+    m_to_ft = _unit_conversion_factor(pyo.units.m, pyo.units.feet)
+    m_to_in = _unit_conversion_factor(pyo.units.m, pyo.units.inch)
+    tower_height_ft = m_to_ft * ax.tower_height
+    tower_diam_in = m_to_in * ax.tower_diam
+
+    # Blower cost correlation takes the air flow as a number in m3/hr
+    flow_vol_air_units = pyo.units.get_units(prop_in.flow_vol_phase["Vap"])
+    flow_vol_air = (
+        pyo.units.convert_value(
+            1, from_units=flow_vol_air_units, to_units=pyo.units.m**3 / pyo.units.hr
         )
-        * pyo.units.hr
-        / pyo.units.m**3,
-        to_units=pyo.units.dimensionless,
+        * prop_in.flow_vol_phase["Vap"]
+        / flow_vol_air_units
     )
 
     base_currency = blk.config.flowsheet_costing_block.base_currency
 
+    # Currency conversion factors are computed once here rather than
+    # wrapping each cost correlation in pyo.units.convert
+    usd_1991_to_base = _unit_conversion_factor(pyo.units.USD_1991, base_currency)
+    usd_2000_to_base = _unit_conversion_factor(pyo.units.USD_2000, base_currency)
+    usd_2010_to_base = _unit_conversion_factor(pyo.units.USD_2010, base_currency)
+
     # default packing material is PVC
     if packing_material == "ceramic":
         ax_params.capital_cost_packing.fix(2000)
     if packing_material == "stainless_steel":
         ax_params.capital_cost_packing.fix(8000)
 
-    blk.tower_cost = pyo.Var(
-        initialize=1e5,
-        bounds=(0, None),
-        units=base_currency,
+    # Polynomial cost correlations are Expressions rather than Var/Constraint
+    # pairs so they do not add rows to the problem; only the non-polynomial
+    # pump and blower costs are kept as Vars
+    blk.tower_cost = pyo.Expression(
+        expr=usd_1991_to_base
+        * tower_height_ft
+        * (
+            ax_params.capital_cost_tower_A_param
+            + ax_params.capital_cost_tower_B_param * tower_diam_in
+            + ax_params.capital_cost_tower_C_param * tower_diam_in**2
+        ),
         doc="Aluminum tower cost",
     )
 
-    blk.port_cost = pyo.Var(
-        initialize=1e5,
-        bounds=(0, None),
-        units=base_currency,
+    blk.port_cost = pyo.Expression(
+        expr=usd_1991_to_base
+        * (
+            ax_params.capital_cost_port_A_param
+            + ax_params.capital_cost_port_B_param * ax.tower_port_diameter
+            + ax_params.capital_cost_port_C_param * ax.tower_port_diameter**2
+            + ax_params.capital_cost_port_D_param * ax.tower_port_diameter**3
+        ),
         doc="Aluminum access port system cost",
     )
 
-    blk.piping_liq_cost = pyo.Var(
-        initialize=1e5,
-        bounds=(0, None),
-        units=base_currency,
+    blk.piping_liq_cost = pyo.Expression(
+        expr=2
+        * usd_1991_to_base
+        * (
+            ax_params.capital_cost_pipe_A_param
+            + ax_params.capital_cost_pipe_B_param * ax.tower_pipe_diameter
+            + ax_params.capital_cost_pipe_C_param * ax.tower_pipe_diameter**2
+        ),
         doc="Liquid inlet/outlet piping cost",
     )
 
-    blk.piping_air_cost = pyo.Var(
-        initialize=1e5,
-        bounds=(0, None),
-        units=base_currency,
+    blk.piping_air_cost = pyo.Expression(
+        expr=blk.piping_liq_cost * ax_params.capital_cost_pipe_air_param,
         doc="Air inlet piping cost",
     )
 
-    blk.tray_ring_cost = pyo.Var(
-        initialize=1e5,
-        bounds=(0, None),
-        units=base_currency,
+    blk.tray_ring_cost = pyo.Expression(
+        expr=usd_1991_to_base
+        * (
+            ax_params.capital_cost_tray_rings_A_param
+            + ax_params.capital_cost_tray_rings_B_param * tower_diam_in
+            + ax_params.capital_cost_tray_rings_C_param * tower_diam_in**2
+        ),
         doc="Tray ring cost",
     )
 
-    blk.distributor_cost = pyo.Var(
-        initialize=1e5,
-        bounds=(0, None),
-        units=base_currency,
+    blk.distributor_cost = pyo.Expression(
+        expr=usd_1991_to_base
+        * (
+            ax_params.capital_cost_tray_A_param
+            + ax_params.capital_cost_tray_B_param * tower_diam_in
+            + ax_params.capital_cost_tray_C_param * tower_diam_in**2
+        ),
         doc="Tray cost",
     )
 
-    blk.plate_cost = pyo.Var(
-        initialize=1e5,
-        bounds=(0, None),
-        units=base_currency,
+    blk.plate_cost = pyo.Expression(
+        expr=usd_1991_to_base
+        * (
+            ax_params.capital_cost_distr_A_param
+            + ax_params.capital_cost_distr_B_param * tower_diam_in
+            + ax_params.capital_cost_distr_C_param * tower_diam_in**2
+        ),
         doc="Plate cost",
     )
 
-    blk.tower_internals_cost = pyo.Var(
-        initialize=1e5,
-        bounds=(0, None),
-        units=base_currency,
+    blk.tower_internals_cost = pyo.Expression(
+        expr=blk.distributor_cost + blk.plate_cost,
         doc="Tower internals cost",
     )
 
-    blk.packing_cost = pyo.Var(
-        initialize=1e5,
-        bounds=(0, None),
-        units=base_currency,
+    blk.packing_cost = pyo.Expression(
+        expr=usd_2010_to_base * ax_params.capital_cost_packing * ax.packing_volume,
         doc="Packing material cost",
     )
 
-    blk.mist_eliminator_cost = pyo.Var(
-        initialize=1e5,
-        bounds=(0, None),
-        units=base_currency,
+    blk.mist_eliminator_cost = pyo.Expression(
+        expr=usd_1991_to_base
+        * (
+            ax_params.capital_cost_mist_elim_A_param
+            + ax_params.capital_cost_mist_elim_B_param * tower_diam_in
+            + ax_params.capital_cost_mist_elim_C_param * tower_diam_in**2
+        ),
         doc="Mist eliminator cost",
     )
 
@@ -360,142 +405,41 @@ def cost_air_stripping(blk):
         doc="Air blower cost",
     )
 
-    blk.tower_cost_constraint = pyo.Constraint(
-        expr=blk.tower_cost
-        == pyo.units.convert(
-            (
-                tower_height_ft
-                * (
-                    ax_params.capital_cost_tower_A_param
-                    + ax_params.capital_cost_tower_B_param * tower_diam_in
-                    + ax_params.capital_cost_tower_C_param * tower_diam_in**2
-                )
-            ),
-            to_units=base_currency,
-        )
-    )
-
-    capital_cost_expr = blk.tower_cost
-
-    blk.port_cost_constraint = pyo.Constraint(
-        expr=blk.port_cost
-        == pyo.units.convert(
-            ax_params.capital_cost_port_A_param
-            + ax_params.capital_cost_port_B_param * ax.tower_port_diameter
-            + ax_params.capital_cost_port_C_param * ax.tower_port_diameter**2
-            + ax_params.capital_cost_port_D_param * ax.tower_port_diameter**3,
-            to_units=base_currency,
-        )
-    )
-
-    capital_cost_expr += blk.port_cost
-
-    blk.piping_liq_cost_constraint = pyo.Constraint(
-        expr=blk.piping_liq_cost
-        == 2
-        * pyo.units.convert(
-            ax_params.capital_cost_pipe_A_param
-            + ax_params.capital_cost_pipe_B_param * ax.tower_pipe_diameter
-            + ax_params.capital_cost_pipe_C_param * ax.tower_pipe_diameter**2,
-            to_units=base_currency,
-        )
-    )
-
-    capital_cost_expr += blk.piping_liq_cost
-
-    blk.piping_air_cost_constraint = pyo.Constraint(
-        expr=blk.piping_air_cost
-        == blk.piping_liq_cost * ax_params.capital_cost_pipe_air_param
-    )
-
-    capital_cost_expr += blk.piping_air_cost
-
-    blk.tray_ring_cost_constraint = pyo.Constraint(
-        expr=blk.tray_ring_cost
-        == pyo.units.convert(
-            ax_params.capital_cost_tray_rings_A_param
-            + ax_params.capital_cost_tray_rings_B_param * tower_diam_in
-            + ax_params.capital_cost_tray_rings_C_param * tower_diam_in**2,
-            to_units=base_currency,
-        )
-    )
-
-    capital_cost_expr += blk.tray_ring_cost
-
-    blk.tray_cost_constraint = pyo.Constraint(
-        expr=blk.distributor_cost
-        == pyo.units.convert(
-            ax_params.capital_cost_tray_A_param
-            + ax_params.capital_cost_tray_B_param * tower_diam_in
-            + ax_params.capital_cost_tray_C_param * tower_diam_in**2,
-            to_units=base_currency,
-        )
-    )
-
-    blk.plate_cost_constraint = pyo.Constraint(
-        expr=blk.plate_cost
-        == pyo.units.convert(
-            ax_params.capital_cost_distr_A_param
-            + ax_params.capital_cost_distr_B_param * tower_diam_in
-            + ax_params.capital_cost_distr_C_param * tower_diam_in**2,
-            to_units=base_currency,
-        )
-    )
-
-    blk.tower_internals_cost_constraint = pyo.Constraint(
-        expr=blk.tower_internals_cost == blk.distributor_cost + blk.plate_cost
-    )
-
-    capital_cost_expr += blk.tower_internals_cost
-
-    blk.packing_cost_constraint = pyo.Constraint(
-        expr=blk.packing_cost
-        == pyo.units.convert(
-            ax_params.capital_cost_packing * ax.packing_volume, to_units=base_currency
-        )
-    )
-
-    capital_cost_expr += blk.packing_cost
-
-    blk.mist_eliminator_cost_constraint = pyo.Constraint(
-        expr=blk.mist_eliminator_cost
-        == pyo.units.convert(
-            ax_params.capital_cost_mist_elim_A_param
-            + ax_params.capital_cost_mist_elim_B_param * tower_diam_in
-            + ax_params.capital_cost_mist_elim_C_param * tower_diam_in**2,
-            to_units=base_currency,
-        )
-    )
-
-    capital_cost_expr += blk.mist_eliminator_cost
-
     blk.pump_cost_constraint = pyo.Constraint(
         expr=blk.pump_cost
-        == pyo.units.convert(
-            ax_params.capital_cost_pump_base_param
-            * (ax.pump_power / ax_params.capital_cost_pump_denom_param)
-            ** ax_params.capital_cost_pump_exponent,
-            to_units=base_currency,
-        )
+        == usd_2000_to_base
+        * ax_params.capital_cost_pump_base_param
+        * (ax.pump_power / ax_params.capital_cost_pump_denom_param)
+        ** ax_params.capital_cost_pump_exponent
     )
 
-    capital_cost_expr += blk.pump_cost
-
     blk.blower_cost_constraint = pyo.Constraint(
         expr=blk.blower_cost
-        == pyo.units.convert(
+        == usd_2010_to_base
+        * (
             ax_params.capital_cost_blower_intercept
             + ax_params.capital_cost_blower_base
-            * (flow_vol_air) ** ax_params.capital_cost_blower_exponent,
-            to_units=base_currency,
+            * (flow_vol_air) ** ax_params.capital_cost_blower_exponent
         )
     )
 
-    capital_cost_expr += blk.blower_cost
-
     blk.costing_package.add_cost_factor(blk, None)
     blk.capital_cost_constraint = pyo.Constraint(
-        expr=blk.capital_cost == capital_cost_expr
+        expr=blk.capital_cost
+        == pyo.quicksum(
+            [
+                blk.tower_cost,
+                blk.port_cost,
+                blk.piping_liq_cost,
+                blk.piping_air_cost,
+                blk.tray_ring_cost,
+                blk.tower_internals_cost,
+                blk.packing_cost,
+                blk.mist_eliminator_cost,
+                blk.pump_cost,
+                blk.blower_cost,
+            ]
+        )
     )
 
     blk.electricity_flow = pyo.Expression(expr=(ax.blower_power + ax.pump_power))
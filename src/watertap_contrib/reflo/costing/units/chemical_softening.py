@@ -26,6 +26,16 @@ from ..util import (
 )
 
 
+def _dimensionless_conversion_factor(from_units, to_units):
+    """
+    Return the number that turns a quantity in from_units into its
+    dimensionless magnitude in to_units.
+    """
+    return (
+        pyunits.convert_value(1, from_units=from_units, to_units=to_units) / from_units
+    )
+
+
 def build_lime_cost_param_block(blk):
 
     blk.cost = Param(
@@ -509,14 +519,25 @@ def cost_chemical_softening(blk):
         units=blk.costing_package.base_currency,
     )
 
+    # Cost correlations take dimensionless magnitudes in US customary units
+    m3_to_ft3 = _dimensionless_conversion_factor(pyunits.m**3, pyunits.ft**3)
+    m2_to_ft2 = _dimensionless_conversion_factor(pyunits.m**2, pyunits.ft**2)
+    kg_day_to_lb_day = _dimensionless_conversion_factor(
+        pyunits.kg / pyunits.day, pyunits.lb / pyunits.day
+    )
+    kg_day_to_lb_hr = _dimensionless_conversion_factor(
+        pyunits.kg / pyunits.day, pyunits.lb / pyunits.hr
+    )
+    m3_s_to_mgd = _dimensionless_conversion_factor(
+        pyunits.m**3 / pyunits.s, pyunits.Mgallons / pyunits.day
+    )
+
     # Capital cost component constraints
 
     capital_cost_expr = 0
 
     # Mixing tank
-    blk.volume_mixer_ft3_dimensionless = pyunits.convert(
-        blk.unit_model.volume_mixer * pyunits.ft**-3, to_units=pyunits.dimensionless
-    )
+    blk.volume_mixer_ft3_dimensionless = m3_to_ft3 * blk.unit_model.volume_mixer
     blk.mix_tank_capital_cost_constraint = Constraint(
         expr=blk.mix_tank_capital_cost
         == pyunits.convert(
@@ -544,9 +565,8 @@ def cost_chemical_softening(blk):
     capital_cost_expr += blk.floc_tank_capital_cost * blk.unit_model.number_floc
 
     # Sedimentation basin
-    blk.sed_basin_effective_settling_area_ft2_dimensionless = pyunits.convert(
-        blk.unit_model.volume_sed / chem_soft.sed_basin_depth * pyunits.ft**-2,
-        to_units=pyunits.dimensionless,
+    blk.sed_basin_effective_settling_area_ft2_dimensionless = (
+        m2_to_ft2 * blk.unit_model.volume_sed / chem_soft.sed_basin_depth
     )
     blk.sed_basin_capital_cost_constraint = Constraint(
         expr=blk.sed_basin_capital_cost
@@ -563,9 +583,7 @@ def cost_chemical_softening(blk):
     capital_cost_expr += blk.sed_basin_capital_cost
 
     # Recarbonation basin
-    blk.recarb_basin_vol_ft3_dimensionless = pyunits.convert(
-        blk.unit_model.volume_recarb * pyunits.ft**-3, to_units=pyunits.dimensionless
-    )
+    blk.recarb_basin_vol_ft3_dimensionless = m3_to_ft3 * blk.unit_model.volume_recarb
     blk.recarb_basin_capital_cost_constraint = Constraint(
         expr=blk.recarb_basin_capital_cost
         == pyunits.convert(
@@ -579,13 +597,11 @@ def cost_chemical_softening(blk):
     capital_cost_expr += blk.recarb_basin_capital_cost
 
     # Recarbonation source cost
-    blk.recarb_source_first_basin_lb_day_dimensionless = pyunits.convert(
-        blk.unit_model.CO2_first_basin * pyunits.day * pyunits.lb**-1,
-        to_units=pyunits.dimensionless,
+    blk.recarb_source_first_basin_lb_day_dimensionless = (
+        kg_day_to_lb_day * blk.unit_model.CO2_first_basin
     )
-    blk.recarb_source_second_basin_lb_day_dimensionless = pyunits.convert(
-        blk.unit_model.CO2_second_basin * pyunits.day * pyunits.lb**-1,
-        to_units=pyunits.dimensionless,
+    blk.recarb_source_second_basin_lb_day_dimensionless = (
+        kg_day_to_lb_day * blk.unit_model.CO2_second_basin
     )
     blk.recarb_basin_source_capital_cost_constraint = Constraint(
         expr=blk.recarb_basin_source_capital_cost
@@ -603,10 +619,7 @@ def cost_chemical_softening(blk):
     capital_cost_expr += blk.recarb_basin_source_capital_cost
 
     # Lime feed system cost
-    blk.lime_dosing_lb_hr_dimensionless = pyunits.convert(
-        blk.unit_model.CaO_dosing * pyunits.hr * pyunits.lb**-1,
-        to_units=pyunits.dimensionless,
-    )
+    blk.lime_dosing_lb_hr_dimensionless = kg_day_to_lb_hr * blk.unit_model.CaO_dosing
     blk.lime_feed_system_capital_cost_constraint = Constraint(
         expr=blk.lime_feed_system_capital_cost
         == pyunits.convert(
@@ -620,11 +633,8 @@ def cost_chemical_softening(blk):
     capital_cost_expr += blk.lime_feed_system_capital_cost
 
     # Admin cost
-    flow_vol_mgd_dimensionless = pyunits.convert(
-        blk.unit_model.properties_in[0].flow_vol_phase["Liq"]
-        * pyunits.day
-        * pyunits.Mgallons**-1,
-        to_units=pyunits.dimensionless,
+    flow_vol_mgd_dimensionless = (
+        m3_s_to_mgd * blk.unit_model.properties_in[0].flow_vol_phase["Liq"]
     )
     blk.admin_capital_cost_constraint = Constraint(
         expr=blk.admin_capital_cost
@@ -642,9 +652,7 @@ def cost_chemical_softening(blk):
     op_cost_expr = 0
 
     # Mixing tank
-    blk.mixer_volume_ft3_dimensionless = pyunits.convert(
-        blk.unit_model.volume_mixer * pyunits.ft**-3, to_units=pyunits.dimensionless
-    )
+    blk.mixer_volume_ft3_dimensionless = blk.volume_mixer_ft3_dimensionless
     blk.mix_tank_op_cost_constraint = Constraint(
         expr=blk.mixer_op_cost
         == pyunits.convert(
@@ -658,9 +666,7 @@ def cost_chemical_softening(blk):
     op_cost_expr += blk.mixer_op_cost
 
     # Flocculation tank
-    blk.floc_vol_ft3_dimensionless = pyunits.convert(
-        blk.unit_model.volume_floc * pyunits.ft**-3, to_units=pyunits.dimensionless
-    )
+    blk.floc_vol_ft3_dimensionless = m3_to_ft3 * blk.unit_model.volume_floc
     blk.floc_tank_op_cost_constraint = Constraint(
         expr=blk.floc_tank_op_cost
         == pyunits.convert(
@@ -674,9 +680,8 @@ def cost_chemical_softening(blk):
     op_cost_expr += blk.floc_tank_op_cost
 
     # Sedimentation basin
-    blk.sed_surf_area_ft2_dimensionless = pyunits.convert(
-        (blk.unit_model.volume_sed / chem_soft.sed_basin_depth) * pyunits.ft**-2,
-        to_units=pyunits.dimensionless,
+    blk.sed_surf_area_ft2_dimensionless = (
+        blk.sed_basin_effective_settling_area_ft2_dimensionless
     )
     blk.sed_basin_op_cost_constraint = Constraint(
         expr=blk.sed_basin_op_cost
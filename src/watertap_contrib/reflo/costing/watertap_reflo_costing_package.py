@@ -9,6 +9,10 @@
 # information, respectively. These files are also available online at the URL
 # "https://github.com/watertap-org/watertap/"
 #################################################################################
+import copy
+import os
+from functools import lru_cache
+from types import SimpleNamespace
 
 from pyomo.common.config import ConfigValue
 import pyomo.environ as pyo
@@ -23,10 +27,51 @@ from watertap.costing.watertap_costing_package import (
     WaterTAPCostingData,
     WaterTAPCostingBlockData,
 )
-from watertap.costing.zero_order_costing import _load_case_study_definition
+from watertap.costing.zero_order_costing import (
+    _load_case_study_definition as _load_watertap_case_study_definition,
+)
 
 _log = idaeslog.getLogger(__name__)
 
+_technoeconomic_data_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data", "technoeconomic"
+)
+
+
+def _resolve_case_study_path(source_file):
+    """
+    Resolve a case study definition to an absolute path. File names that do not
+    exist relative to the working directory are looked up in the
+    WaterTAP-REFLO technoeconomic data directory.
+    """
+    if not os.path.isfile(source_file):
+        packaged_file = os.path.join(_technoeconomic_data_dir, source_file)
+        if os.path.isfile(packaged_file):
+            source_file = packaged_file
+    return os.path.abspath(source_file)
+
+
+@lru_cache(maxsize=16)
+def _parse_case_study_definition(source_file, mtime):
+    # WaterTAP's loader only reads config.case_study_definition from the block
+    return _load_watertap_case_study_definition(
+        SimpleNamespace(config=SimpleNamespace(case_study_definition=source_file))
+    )
+
+
+def _load_case_study_definition(self):
+    """
+    Load data from case study definition file into a Python dict.
+    Parsed files are cached on their resolved path and modification time
+    so repeated flowsheet builds do not re-read the YAML.
+    """
+    source_file = _resolve_case_study_path(self.config.case_study_definition)
+    if not os.path.isfile(source_file):
+        # Let WaterTAP's loader report the missing file
+        return _load_watertap_case_study_definition(self)
+    mtime = os.path.getmtime(source_file)
+    return copy.deepcopy(_parse_case_study_definition(source_file, mtime))
+
 
 @declare_process_block_class("REFLOCosting")
 class REFLOCostingData(WaterTAPCostingData):
@@ -36,8 +81,9 @@ class REFLOCostingData(WaterTAPCostingData):
         "case_study_definition",
         ConfigValue(
             default=None,
-            doc="Path to YAML file defining global parameters for case study. If "
-            "not provided, WaterTAP-REFLO values are used.",
+            doc="Path to YAML file defining global parameters for case study, or "
+            "the name of a file in the WaterTAP-REFLO technoeconomic data directory. "
+            "If not provided, WaterTAP-REFLO values are used.",
         ),
     )
 
@@ -181,9 +227,7 @@ class EnergyCostingData(REFLOCostingData):
 
         self.base_energy_units = pyo.units.kilowatt * pyo.units.hour
 
-        self.plant_lifetime_set = pyo.Set(
-            initialize=range(pyo.value(self.plant_lifetime) + 1)
-        )
+        self.plant_lifetime_set = pyo.RangeSet(0, pyo.value(self.plant_lifetime))
 
         self.annual_electrical_system_degradation = pyo.Param(
             initialize=0.005,
@@ -254,7 +298,9 @@ class EnergyCostingData(REFLOCostingData):
         def rule_lifetime_electricity_production(b):
             return (
                 b.lifetime_electricity_production
-                == sum(b.yearly_electricity_production[y] for y in b.plant_lifetime_set)
+                == pyo.quicksum(
+                    b.yearly_electricity_production[y] for y in b.plant_lifetime_set
+                )
                 * b.utilization_factor
             )
 
@@ -288,7 +334,9 @@ class EnergyCostingData(REFLOCostingData):
         def rule_lifetime_heat_production(b):
             return (
                 b.lifetime_heat_production
-                == sum(b.yearly_heat_production[y] for y in b.plant_lifetime_set)
+                == pyo.quicksum(
+                    b.yearly_heat_production[y] for y in b.plant_lifetime_set
+                )
                 * b.utilization_factor
             )
 
@@ -78,6 +78,10 @@ boltzmann = pyunits.convert(
     Constants.boltzmann_constant,
     to_units=(pyunits.g * pyunits.cm**2) / (pyunits.second**2 * pyunits.degK),
 )
+zero_celsius = 273.15 * pyunits.degK
+pascal_per_mmHg = (
+    pyunits.convert_value(1, from_units=pyunits.mmHg, to_units=pyunits.Pa) * pyunits.Pa
+)
 # Set up logger
 _log = idaeslog.getLogger(__name__)
 
@@ -1542,7 +1546,7 @@ class AirWaterEqStateBlockData(StateBlockData):
         )
 
         def rule_saturation_vap_pressure(b, h2o):
-            t = b.temperature["Vap"] - 273.15 * pyunits.degK
+            t = b.temperature["Vap"] - zero_celsius
             return (
                 b.saturation_vap_pressure[h2o]
                 == exp(a - (b_ / (t + d1))) / (t + d2) ** c
@@ -1582,13 +1586,9 @@ class AirWaterEqStateBlockData(StateBlockData):
         )
 
         def rule_vap_pressure(b, h2o):
-            t = pyunits.convert(
-                (b.temperature["Liq"] - 273.15 * pyunits.degK) * pyunits.degK**-1,
-                to_units=pyunits.dimensionless,
-            )
+            t = (b.temperature["Liq"] - zero_celsius) / pyunits.degK
             antoine = a - (b_ / (c + t))
-            p_vap = 10 ** (antoine) * pyunits.mmHg
-            return b.vap_pressure[h2o] == pyunits.convert(p_vap, to_units=pyunits.Pa)
+            return b.vap_pressure[h2o] == 10 ** (antoine) * pascal_per_mmHg
 
         self.eq_vap_pressure = Constraint(["H2O"], rule=rule_vap_pressure)
 
@@ -11,17 +11,16 @@
 #################################################################################
 
 import os
+import argparse
 from pathlib import Path
-import sys
 import re
+from contextlib import redirect_stdout
 import numpy as np
 import pandas as pd
 from io import StringIO
 import matplotlib.pyplot as plt
 from pyomo.environ import ConcreteModel, value, Var, Objective, maximize
-from pyomo.common.timing import TicTocTimer
 
-from idaes.core.surrogate.sampling.data_utils import split_training_validation
 from idaes.core.surrogate.pysmo_surrogate import PysmoRBFTrainer, PysmoSurrogate
 from idaes.core.surrogate.surrogate_block import SurrogateBlock
 from idaes.core import FlowsheetBlock
@@ -35,11 +34,6 @@ from watertap_contrib.reflo.solar_models.surrogate.trough.trough_surrogate impor
 def create_rbf_surrogate(
     training_dataframe, input_labels, output_labels, output_filename=None, tee=False
 ):
-    # Capture long output
-    stream = StringIO()
-    oldstdout = sys.stdout
-    sys.stdout = stream
-
     # Create PySMO trainer object
     trainer = PysmoRBFTrainer(
         input_labels=input_labels,
@@ -52,8 +46,12 @@ def create_rbf_surrogate(
     trainer.config.solution_method = "algebraic"  # default = algebraic
     trainer.config.regularization = True  # default = True
 
-    # Train surrogate
-    rbf_train = trainer.train_surrogate()
+    # Train surrogate, capturing its long output only if it will be displayed
+    stream = StringIO() if tee else open(os.devnull, "w")
+    with stream, redirect_stdout(stream):
+        rbf_train = trainer.train_surrogate()
+        if tee:
+            celloutput = stream.getvalue().split("\n")
 
     # Remove autogenerated 'solution.pickle' file
     try:
@@ -74,12 +72,8 @@ def create_rbf_surrogate(
     if output_filename is not None:
         model = rbf_surr.save_to_file(output_filename, overwrite=True)
 
-    # Revert back to standard output
-    sys.stdout = oldstdout
-
     if tee:
         # Display first 50 lines and last 50 lines of output
-        celloutput = stream.getvalue().split("\n")
         for line in celloutput[:50]:
             print(line)
         print(".")
@@ -92,7 +86,12 @@ def create_rbf_surrogate(
 
 
 def get_training_validation(
-    dataset_filename, n_samples, training_fraction, heat_load_range, hours_storage_range
+    dataset_filename,
+    n_samples,
+    training_fraction,
+    heat_load_range,
+    hours_storage_range,
+    seed=None,
 ):
     pkl_data = pd.read_pickle(dataset_filename)
     pkl_data = pkl_data[
@@ -108,16 +107,37 @@ def get_training_validation(
             "The provided dataset doesn't have enough entries matching the ranges in `heat_load_range` and `hours_storage_range` to give the requested number of samples. "
             "Check that the range is correct, reduce the number of samples, or generate a new dataset that contains enough samples."
         )
-    data = pkl_data.sample(n=n_samples)
-    data_training, data_validation = split_training_validation(
-        data, training_fraction, seed=len(data)
-    )  # each has all columns
+    # Sample and split with a single permutation, each has all columns
+    sample = np.random.default_rng(seed).permutation(len(pkl_data))[:n_samples]
+    n_training = int(n_samples * training_fraction)
+    data_training = pkl_data.iloc[sample[:n_training]].reset_index(drop=True)
+    data_validation = pkl_data.iloc[sample[n_training:]].reset_index(drop=True)
     return data_training, data_validation
 
 
+def _evaluate_rbf_surrogate(surrogate, data):
+    """
+    Evaluate a PySMO RBF surrogate at every row of data with one
+    predict_output call per output. PysmoSurrogate.evaluate_surrogate gives
+    the same values but predicts one row at a time.
+    """
+    x = data[surrogate.input_labels()].to_numpy(dtype=np.float64)
+    return pd.DataFrame(
+        {
+            output_label: surrogate._trained.get_result(output_label)
+            .model.predict_output(x)
+            .ravel()
+            for output_label in surrogate.output_labels()
+        },
+        index=data.index,
+    )
+
+
 def _parity_residual_plots(
     true_values, modeled_values, label=None, axis_fontsize=18, title_fontsize=22
 ):
+    residuals = true_values - modeled_values
+
     fig1 = plt.figure(figsize=(13, 6), tight_layout=True)
     if label is not None:
         fig1.suptitle(label, fontsize=title_fontsize)
@@ -131,7 +151,7 @@ def _parity_residual_plots(
     ax2 = fig1.add_subplot(122)
     ax2.plot(
         true_values,
-        true_values - modeled_values,
+        residuals,
         "s",
         mfc="w",
         mec="m",
@@ -142,9 +162,7 @@ def _parity_residual_plots(
     ax2.set_ylabel(r"Residuals", fontsize=axis_fontsize)
     ax2.set_title(r"Residual plot", fontsize=axis_fontsize)
 
-    plt.show()
-
-    return
+    return fig1
 
 
 def plot_training_validation(
@@ -155,6 +173,14 @@ def plot_training_validation(
     output_labels,
     save_figs=False,
 ):
+    # Surrogate outputs do not depend on the plotted label, evaluate them once
+    training_output = _evaluate_rbf_surrogate(surrogate, data_training)
+    validation_output = _evaluate_rbf_surrogate(surrogate, data_validation)
+
+    plot_dir = Path(__file__).parent / "plots"
+    if save_figs:
+        plot_dir.mkdir(exist_ok=True)
+
     for output_label in output_labels:
         # Output fit metrics and create parity and residual plots
         print(
@@ -164,34 +190,48 @@ def plot_training_validation(
                 rmse=surrogate._trained._data[output_label].model.rmse,
             )
         )
-        training_output = surrogate.evaluate_surrogate(data_training[input_labels])
         label = re.sub(
-            "[^a-zA-Z0-9 \n\.]", " ", output_label.title()
+            r"[^a-zA-Z0-9 \n\.]", " ", output_label.title()
         )  # keep alphanumeric chars and make title case
-        _parity_residual_plots(
-            true_values=np.array(data_training[output_label]),
-            modeled_values=np.array(training_output[output_label]),
-            label=label,
-        )
-        if save_figs is not None:
-            plt.savefig(Path(__file__).parent / "plots" / "parity_residual_plots.png")
-            plt.close()
-
-        # Validate model using validation data
-        validation_output = surrogate.evaluate_surrogate(data_validation[input_labels])
-        _parity_residual_plots(
-            true_values=np.array(data_validation[output_label]),
-            modeled_values=np.array(validation_output[output_label]),
-            label=label,
-        )
 
-        if save_figs is not None:
-            plt.savefig(Path(__file__).parent / "plots" / "parity_residual_plots.png")
-            plt.close()
+        # Plot training data, then validate model using validation data
+        for data_name, data, output in [
+            ("training", data_training, training_output),
+            ("validation", data_validation, validation_output),
+        ]:
+            fig = _parity_residual_plots(
+                true_values=data[output_label].to_numpy(),
+                modeled_values=output[output_label].to_numpy(),
+                label=label,
+            )
+            if save_figs:
+                fig.savefig(
+                    plot_dir / f"{output_label}_{data_name}_parity_residual_plots.png"
+                )
+                plt.close(fig)
+
+    # Show all remaining figures together rather than blocking on each one
+    if not save_figs:
+        plt.show()
 
 
 #########################################################################################################
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Train the trough surrogate and plot its fit"
+    )
+    parser.add_argument(
+        "--solve",
+        action="store_true",
+        help="also build and solve a flowsheet with the trained surrogate",
+    )
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="also maximize the annual heat output of that flowsheet",
+    )
+    args = parser.parse_args()
+
     heat_load_range = (10, 100)  # must be (10, 100) or (100, 500)
     hours_storage_range = (0, 26)
     dataset_filename = Path(__file__).parent / "trough_data.pkl"
@@ -242,93 +282,87 @@ if __name__ == "__main__":
         surrogate, data_training, data_validation, input_labels, output_labels
     )
 
-    ### Build and run IDAES flowsheet #########################################################################################
-    m = ConcreteModel()
-    m.fs = FlowsheetBlock(dynamic=False)
+    if args.solve or args.optimize:
+        ### Build and run IDAES flowsheet #########################################################################################
+        m = ConcreteModel()
+        m.fs = FlowsheetBlock(dynamic=False)
 
-    # create flowsheet input variables
-    m.fs.heat_load = Var(
-        initialize=heat_load_range[0],
-        bounds=heat_load_range,
-        doc="rated plant heat capacity in MWt",
-    )
-    m.fs.hours_storage = Var(
-        initialize=hours_storage_range[0],
-        bounds=hours_storage_range,
-        doc="rated plant hours of storage",
-    )
-
-    # create flowsheet output variable
-    m.fs.annual_energy_scaled = Var(
-        initialize=data_training["heat_annual_scaled"].mean(),
-        doc="annual heat produced by the plant in kWht",
-    )
-    m.fs.electrical_load_scaled = Var(
-        initialize=data_training["electricity_annual_scaled"].mean(),
-        doc="annual electricity consumed by the plant in kWht",
-    )
+        # create flowsheet input variables
+        m.fs.heat_load = Var(
+            initialize=heat_load_range[0],
+            bounds=heat_load_range,
+            doc="rated plant heat capacity in MWt",
+        )
+        m.fs.hours_storage = Var(
+            initialize=hours_storage_range[0],
+            bounds=hours_storage_range,
+            doc="rated plant hours of storage",
+        )
 
-    # create input and output variable object lists for flowsheet
-    inputs = [m.fs.heat_load, m.fs.hours_storage]
-    outputs = [m.fs.annual_energy_scaled, m.fs.electrical_load_scaled]
-
-    # capture long output
-    stream = StringIO()
-    oldstdout = sys.stdout
-    sys.stdout = stream
-
-    m.fs.surrogate = SurrogateBlock(concrete=True)
-    m.fs.surrogate.build_model(surrogate, input_vars=inputs, output_vars=outputs)
-
-    # revert back to standard output
-    sys.stdout = oldstdout
-
-    # fix input values and solve flowsheet
-    m.fs.heat_load.fix(heat_load_range[0])
-    m.fs.hours_storage.fix(hours_storage_range[0])
-    solver = get_solver()
-    results = solver.solve(m)
-
-    print("\n")
-    print("Heat rate = {x:.0f} MWt".format(x=value(m.fs.heat_load)))
-    print("Hours of storage = {x:.1f} hrs".format(x=value(m.fs.hours_storage)))
-    print(
-        "Annual heat output = {x:.2e} kWht".format(
-            x=value(m.fs.annual_energy_scaled) / scaling
+        # create flowsheet output variable
+        m.fs.annual_energy_scaled = Var(
+            initialize=data_training["heat_annual_scaled"].mean(),
+            doc="annual heat produced by the plant in kWht",
         )
-    )
-    print(
-        "Annual electricity input = {x:.2e} kWhe".format(
-            x=value(m.fs.electrical_load_scaled) / scaling
+        m.fs.electrical_load_scaled = Var(
+            initialize=data_training["electricity_annual_scaled"].mean(),
+            doc="annual electricity consumed by the plant in kWht",
         )
-    )
 
-    ### Optimize the surrogate model #########################################################################################
-    m.fs.heat_load.unfix()
-    m.fs.hours_storage.unfix()
-    m.fs.obj = Objective(expr=m.fs.annual_energy_scaled, sense=maximize)
-
-    # solve the optimization
-    print("\n")
-    print("Optimizing annual energy...")
-    tmr = TicTocTimer()
-    status = solver.solve(m, tee=False)
-    solve_time = tmr.toc("solve")
-
-    print("Model status: ", status)
-    print("Solve time: ", solve_time)
-    print("Heat rate = {x:.0f} MWt".format(x=value(m.fs.heat_load)))
-    print("Hours of storage = {x:.1f} hrs".format(x=value(m.fs.hours_storage)))
-    print(
-        "Annual heat output = {x:.2e} kWht".format(
-            x=value(m.fs.annual_energy_scaled) / scaling
+        # create input and output variable object lists for flowsheet
+        inputs = [m.fs.heat_load, m.fs.hours_storage]
+        outputs = [m.fs.annual_energy_scaled, m.fs.electrical_load_scaled]
+
+        # discard long output
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            m.fs.surrogate = SurrogateBlock(concrete=True)
+            m.fs.surrogate.build_model(
+                surrogate, input_vars=inputs, output_vars=outputs
+            )
+
+        # fix input values and solve flowsheet
+        m.fs.heat_load.fix(heat_load_range[0])
+        m.fs.hours_storage.fix(hours_storage_range[0])
+        solver = get_solver()
+        results = solver.solve(m)
+
+        print("\n")
+        print("Heat rate = {x:.0f} MWt".format(x=value(m.fs.heat_load)))
+        print("Hours of storage = {x:.1f} hrs".format(x=value(m.fs.hours_storage)))
+        print(
+            "Annual heat output = {x:.2e} kWht".format(
+                x=value(m.fs.annual_energy_scaled) / scaling
+            )
         )
-    )
-    print(
-        "Annual electricity input = {x:.2e} kWhe".format(
-            x=value(m.fs.electrical_load_scaled) / scaling
+        print(
+            "Annual electricity input = {x:.2e} kWhe".format(
+                x=value(m.fs.electrical_load_scaled) / scaling
+            )
         )
-    )
 
-    x = 1
-    pass
+    if args.optimize:
+        ### Optimize the surrogate model #########################################################################################
+        m.fs.heat_load.unfix()
+        m.fs.hours_storage.unfix()
+        m.fs.obj = Objective(expr=m.fs.annual_energy_scaled, sense=maximize)
+
+        # solve the optimization
+        print("\n")
+        print("Optimizing annual energy...")
+        status = solver.solve(m, tee=False)
+        solve_time = status.solver.time
+
+        print("Model status: ", status)
+        print("Solve time: ", solve_time)
+        print("Heat rate = {x:.0f} MWt".format(x=value(m.fs.heat_load)))
+        print("Hours of storage = {x:.1f} hrs".format(x=value(m.fs.hours_storage)))
+        print(
+            "Annual heat output = {x:.2e} kWht".format(
+                x=value(m.fs.annual_energy_scaled) / scaling
+            )
+        )
+        print(
+            "Annual electricity input = {x:.2e} kWhe".format(
+                x=value(m.fs.electrical_load_scaled) / scaling
+            )
+        )
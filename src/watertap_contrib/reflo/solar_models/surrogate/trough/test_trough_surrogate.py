@@ -331,3 +331,40 @@ class TestTroughLarge:
                     assert pytest.approx(s, rel=1e-2) == value(cv[i])
             else:
                 assert pytest.approx(r, rel=1e-1) == value(cv)
+
+
+class TestTroughLoadSurrogate:
+    @pytest.fixture(scope="class")
+    def trough_frame(self):
+        m = ConcreteModel()
+        m.fs = FlowsheetBlock(dynamic=False)
+        m.fs.trough1 = TroughSurrogate(
+            surrogate_model_file=test_surrogate_filename, **trough_dict
+        )
+        m.fs.trough2 = TroughSurrogate(
+            surrogate_model_file=test_surrogate_filename, **trough_dict
+        )
+        return m
+
+    @pytest.mark.unit
+    def test_surrogate_cached(self, trough_frame):
+        m = trough_frame
+        assert m.fs.trough1.surrogate_file == test_surrogate_filename
+        assert m.fs.trough1.surrogate is m.fs.trough2.surrogate
+        assert isinstance(m.fs.trough1.surrogate_blk, SurrogateBlock)
+        assert isinstance(m.fs.trough2.surrogate_blk, SurrogateBlock)
+        assert number_total_constraints(m.fs.trough1) == 4
+        assert number_total_constraints(m.fs.trough2) == 4
+
+    @pytest.mark.unit
+    def test_evaluate_surrogate_cached(self, trough_frame):
+        m = trough_frame
+        trough = m.fs.trough1
+        out = trough._evaluate_surrogate(200, 12)
+        assert (200.0, 12.0) in trough._surrogate_cache
+        assert trough._evaluate_surrogate(200, 12) is out
+
+        data = pd.DataFrame({"heat_load": [200], "hours_storage": [12]})
+        expected = trough.surrogate.evaluate_surrogate(data)
+        assert out[0] == pytest.approx(expected.heat_annual_scaled.values[0])
+        assert out[1] == pytest.approx(expected.electricity_annual_scaled.values[0])
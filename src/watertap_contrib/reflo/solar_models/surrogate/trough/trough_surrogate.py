@@ -33,6 +33,9 @@ _log = idaeslog.getLogger(__name__)
 
 __author__ = "Matthew Boyd, Kurban Sitterley"
 
+# Annual to hourly conversion, evaluated once instead of in every constraint
+_years_per_hour = value(pyunits.convert(1 * pyunits.hour, to_units=pyunits.year))
+
 
 @declare_process_block_class("TroughSurrogate")
 class TroughSurrogateData(SolarEnergyBaseData):
@@ -44,6 +47,7 @@ class TroughSurrogateData(SolarEnergyBaseData):
         super().build()
 
         self._tech_type = "trough"
+        self._surrogate_cache = {}
 
         self.add_surrogate_variables()
         self.get_surrogate_data()
@@ -65,45 +69,44 @@ class TroughSurrogateData(SolarEnergyBaseData):
             self.create_rbf_surrogate()
 
         self.heat_constraint = Constraint(
-            expr=self.heat
-            == self.heat_annual
-            * pyunits.convert(1 * pyunits.hour, to_units=pyunits.year)
+            expr=self.heat == self.heat_annual * _years_per_hour * pyunits.year
         )
 
         self.electricity_constraint = Constraint(
             expr=self.electricity
-            == self.electricity_annual
-            * pyunits.convert(1 * pyunits.hour, to_units=pyunits.year)
+            == self.electricity_annual * _years_per_hour * pyunits.year
         )
 
     def calculate_scaling_factors(self):
-        if iscale.get_scaling_factor(self.hours_storage) is None:
-            sf = iscale.get_scaling_factor(self.hours_storage, default=1)
-            iscale.set_scaling_factor(self.hours_storage, sf)
-
-        if iscale.get_scaling_factor(self.heat_load) is None:
-            sf = iscale.get_scaling_factor(self.heat_load, default=1e-3, warning=True)
-            iscale.set_scaling_factor(self.heat_load, sf)
-
-        if iscale.get_scaling_factor(self.heat_annual_scaled) is None:
-            sf = iscale.get_scaling_factor(
-                self.heat_annual_scaled, default=1, warning=True
-            )
-            iscale.set_scaling_factor(self.heat_annual_scaled, sf)
-
-        if iscale.get_scaling_factor(self.heat) is None:
-            sf = iscale.get_scaling_factor(self.heat, default=1e-4, warning=True)
-            iscale.set_scaling_factor(self.heat, sf)
+        # (variable, default scaling factor, warn if default is used)
+        default_scaling = (
+            (self.hours_storage, 1, False),
+            (self.heat_load, 1e-3, True),
+            (self.heat_annual_scaled, 1, True),
+            (self.heat, 1e-4, True),
+            (self.electricity_annual_scaled, 1, True),
+            (self.electricity, 1e-3, True),
+        )
+        for v, default, warning in default_scaling:
+            if iscale.get_scaling_factor(v) is None:
+                sf = iscale.get_scaling_factor(v, default=default, warning=warning)
+                iscale.set_scaling_factor(v, sf)
 
-        if iscale.get_scaling_factor(self.electricity_annual_scaled) is None:
-            sf = iscale.get_scaling_factor(
-                self.electricity_annual_scaled, default=1, warning=True
+    def _evaluate_surrogate(self, heat_load, hours_storage):
+        """
+        Evaluate the surrogate at the given inputs, returning the scaled annual
+        heat and electricity. Results are cached on the block so repeated
+        initializations at the same point skip the RBF evaluation.
+        """
+        key = (float(heat_load), float(hours_storage))
+        if key not in self._surrogate_cache:
+            data = pd.DataFrame({"heat_load": [key[0]], "hours_storage": [key[1]]})
+            output = self.surrogate.evaluate_surrogate(data)
+            self._surrogate_cache[key] = (
+                output.heat_annual_scaled.values[0],
+                output.electricity_annual_scaled.values[0],
             )
-            iscale.set_scaling_factor(self.electricity_annual_scaled, sf)
-
-        if iscale.get_scaling_factor(self.electricity) is None:
-            sf = iscale.get_scaling_factor(self.electricity, default=1e-3, warning=True)
-            iscale.set_scaling_factor(self.electricity, sf)
+        return self._surrogate_cache[key]
 
     def initialize_build(
         self,
@@ -126,19 +129,13 @@ class TroughSurrogateData(SolarEnergyBaseData):
         solve_log = idaeslog.getSolveLogger(self.name, outlvl, tag="unit")
 
         # Initialize surrogate
-        data = pd.DataFrame(
-            {
-                "heat_load": [value(self.heat_load)],
-                "hours_storage": [value(self.hours_storage)],
-            }
-        )
-        init_output = self.surrogate.evaluate_surrogate(data)
-        self.heat_annual_scaled.set_value(init_output.heat_annual_scaled.values[0])
-        self.electricity_annual_scaled.set_value(
-            init_output.electricity_annual_scaled.values[0]
+        heat_annual_scaled, electricity_annual_scaled = self._evaluate_surrogate(
+            value(self.heat_load), value(self.hours_storage)
         )
-        self.heat.set_value(value(self.heat_annual) / 8766)
-        self.electricity.set_value(value(self.electricity_annual) / 8766)
+        self.heat_annual_scaled.set_value(heat_annual_scaled)
+        self.electricity_annual_scaled.set_value(electricity_annual_scaled)
+        self.heat.set_value(value(self.heat_annual) * _years_per_hour)
+        self.electricity.set_value(value(self.electricity_annual) * _years_per_hour)
 
         # Solve unit
         opt = get_solver(solver, optarg)
@@ -327,20 +327,6 @@ class AirStripping0DData(InitializationMixin, UnitModelBlockData):
             doc="Blower power equation exponent",
         )
 
-        self.blower_power = Var(
-            initialize=50,
-            bounds=(0, None),
-            units=pyunits.kilowatt,
-            doc="Air blower power requirement",
-        )
-
-        self.pump_power = Var(
-            initialize=50,
-            bounds=(0, None),
-            units=pyunits.kilowatt,
-            doc="Water pump power requirement",
-        )
-
         self.packing_surface_area_total = Var(
             initialize=100,
             bounds=(0, None),
@@ -622,11 +608,10 @@ class AirStripping0DData(InitializationMixin, UnitModelBlockData):
                 == b.height_transfer_unit[j] * b.number_transfer_unit[j]
             )
 
-        @self.Constraint(doc="Pumping power required.")
-        def eq_pump_power(b):
+        @self.Expression(doc="Water pump power requirement")
+        def pump_power(b):
             return (
-                b.pump_power
-                == pyunits.convert(
+                pyunits.convert(
                     prop_in.flow_mass_phase["Liq"]
                     * b.tower_height
                     * Constants.acceleration_gravity,
@@ -635,10 +620,10 @@ class AirStripping0DData(InitializationMixin, UnitModelBlockData):
                 / b.pump_efficiency
             )
 
-        @self.Constraint(doc="Blower power required.")
-        def eq_blower_power(b):
+        @self.Expression(doc="Air blower power requirement")
+        def blower_power(b):
             pressure_ambient = 101325 * pyunits.Pa
-            return b.blower_power == pyunits.convert(
+            return pyunits.convert(
                 (
                     prop_in.flow_mass_phase["Vap"]
                     * Constants.gas_constant
@@ -1133,12 +1118,6 @@ class AirStripping0DData(InitializationMixin, UnitModelBlockData):
         if iscale.get_scaling_factor(self.pressure_drop_gradient) is None:
             iscale.set_scaling_factor(self.pressure_drop_gradient, 0.1)
 
-        if iscale.get_scaling_factor(self.blower_power) is None:
-            iscale.set_scaling_factor(self.blower_power, 0.1)
-
-        if iscale.get_scaling_factor(self.pump_power) is None:
-            iscale.set_scaling_factor(self.pump_power, 0.1)
-
         iscale.constraint_scaling_transform(
             self.eq_deltaP, iscale.get_scaling_factor(prop_in.pressure)
         )
@@ -1197,12 +1176,12 @@ class AirStripping0DData(InitializationMixin, UnitModelBlockData):
             self.process_flow.mass_transfer_term[time_point, "Liq", target]
         )
         var_dict[f"CV delta P"] = self.process_flow.deltaP[time_point]
-        var_dict[f"Blower power required"] = self.blower_power
-        var_dict[f"Pump power required"] = self.pump_power
 
         expr_dict = dict()
 
         expr_dict["Air-to-water flow ratio, minimum"] = self.air_water_ratio_op
+        expr_dict["Blower power required"] = self.blower_power
+        expr_dict["Pump power required"] = self.pump_power
         expr_dict["Pressure drop through tower"] = self.pressure_drop_tower
         expr_dict["Tower height"] = self.tower_height
         expr_dict["Tower diameter"] = self.tower_diam
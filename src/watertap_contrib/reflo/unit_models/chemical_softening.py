@@ -166,6 +166,10 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
         self.add_port(name="outlet", block=self.properties_out)
         self.add_port(name="waste", block=self.properties_waste)
 
+        prop_in = self.properties_in[0]
+        prop_out = self.properties_out[0]
+        prop_waste = self.properties_waste[0]
+
         comps = self.config.property_package.solute_set
         if not all(rc in comps for rc in required_comps):
             raise ConfigurationError(
@@ -504,7 +508,7 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
         @self.Constraint(doc="Equation to calculate the inlet CO2 in equivalent CaCO3")
         def eq_CO2_CaCO3(b):
             dimensionless_temp = pyunits.convert(
-                b.properties_in[0].temperature * pyunits.degK**-1,
+                prop_in.temperature * pyunits.degK**-1,
                 to_units=pyunits.dimensionless,
             )
             K1 = 10 ** (
@@ -518,10 +522,10 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                 1 / ((10 ** (-b.pH)) / K1 + 1 + K2 / (10 ** (-b.pH)))
             ) * pyunits.dimensionless
             CT = (
-                b.properties_in[0].conc_mass_phase_comp["Liq", "Alkalinity_2-"] / alpha
+                prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"] / alpha
             )  # mg CaCO3 /L
             CO2 = (
-                CT - b.properties_in[0].conc_mass_phase_comp["Liq", "Alkalinity_2-"]
+                CT - prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
             )  # mg CaCO3 /L
 
             return b.CO2_CaCO3 == CO2
@@ -531,16 +535,14 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
         @self.Expression(doc="Calcium in influent converted to equivalent CaCO3")
         def Ca_CaCO3(b):
             return pyunits.convert(
-                b.properties_in[0].conc_mass_phase_comp["Liq", "Ca_2+"]
-                * b.Ca_CaCO3_conv,
+                prop_in.conc_mass_phase_comp["Liq", "Ca_2+"] * b.Ca_CaCO3_conv,
                 to_units=pyunits.kg / pyunits.m**3,
             )
 
         @self.Expression(doc="Magnesium in influent converted to equivalent CaCO3")
         def Mg_CaCO3(b):
             return pyunits.convert(
-                b.properties_in[0].conc_mass_phase_comp["Liq", "Mg_2+"]
-                * b.Mg_CaCO3_conv,
+                prop_in.conc_mass_phase_comp["Liq", "Mg_2+"] * b.Mg_CaCO3_conv,
                 to_units=pyunits.kg / pyunits.m**3,
             )
 
@@ -555,7 +557,7 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
             return b.carbonate_hardness == pyunits.convert(
                 smooth_min(
                     b.total_hardness,
-                    b.properties_in[0].conc_mass_phase_comp["Liq", "Alkalinity_2-"],
+                    prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"],
                     b.eps,
                 ),
                 to_units=pyunits.kg / pyunits.m**3,
@@ -601,33 +603,25 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
         @self.Expression(doc="Mg removal efficiency")
         def mg_removal_eff(b):
             mass_flow_mg_eff = pyunits.convert(
-                b.mg_eff_target * b.properties_out[0].flow_vol_phase["Liq"],
+                b.mg_eff_target * prop_out.flow_vol_phase["Liq"],
                 to_units=pyunits.kg / pyunits.s,
             )
-            return (
-                1
-                - mass_flow_mg_eff
-                / b.properties_in[0].flow_mass_phase_comp["Liq", "Mg_2+"]
-            )
+            return 1 - mass_flow_mg_eff / prop_in.flow_mass_phase_comp["Liq", "Mg_2+"]
 
         @self.Expression(doc="Ca removal efficiency")
         def ca_removal_eff(b):
             mass_flow_ca_eff = pyunits.convert(
-                b.ca_eff_target * b.properties_out[0].flow_vol_phase["Liq"],
+                b.ca_eff_target * prop_out.flow_vol_phase["Liq"],
                 to_units=pyunits.kg / pyunits.s,
             )
-            return (
-                1
-                - mass_flow_ca_eff
-                / b.properties_in[0].flow_mass_phase_comp["Liq", "Ca_2+"]
-            )
+            return 1 - mass_flow_ca_eff / prop_in.flow_mass_phase_comp["Liq", "Ca_2+"]
 
         @self.Expression(
             doc="Lime concentration for inlet stream to achieve dosing target."
         )
         def lime_concentration(b):
             return pyunits.convert(
-                b.CaO_dosing / b.properties_in[0].flow_vol_phase["Liq"],
+                b.CaO_dosing / prop_in.flow_vol_phase["Liq"],
                 to_units=pyunits.gram / pyunits.liter,
             )
 
@@ -636,7 +630,7 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
         )
         def soda_concentration(b):
             return pyunits.convert(
-                b.Na2CO3_dosing / b.properties_in[0].flow_vol_phase["Liq"],
+                b.Na2CO3_dosing / prop_in.flow_vol_phase["Liq"],
                 to_units=pyunits.gram / pyunits.liter,
             )
 
@@ -645,7 +639,7 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
         )
         def co2_first_basin_concentration(b):
             return pyunits.convert(
-                b.CO2_first_basin / b.properties_in[0].flow_vol_phase["Liq"],
+                b.CO2_first_basin / prop_in.flow_vol_phase["Liq"],
                 to_units=pyunits.gram / pyunits.liter,
             )
 
@@ -654,25 +648,25 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
         )
         def co2_second_basin_concentration(b):
             return pyunits.convert(
-                b.CO2_second_basin / b.properties_in[0].flow_vol_phase["Liq"],
+                b.CO2_second_basin / prop_in.flow_vol_phase["Liq"],
                 to_units=pyunits.gram / pyunits.liter,
             )
 
         @self.Constraint(doc="Isothermal outlet")
         def eq_isothermal_outlet(b):
-            return b.properties_in[0].temperature == b.properties_out[0].temperature
+            return prop_in.temperature == prop_out.temperature
 
         @self.Constraint(doc="Isothermal waste")
         def eq_isothermal_waste(b):
-            return b.properties_in[0].temperature == b.properties_waste[0].temperature
+            return prop_in.temperature == prop_waste.temperature
 
         @self.Constraint(doc="Isobaric outlet")
         def eq_isobaric_outlet(b):
-            return b.properties_in[0].pressure == b.properties_out[0].pressure
+            return prop_in.pressure == prop_out.pressure
 
         @self.Constraint(doc="Isobaric waste")
         def eq_isobaric_waste(b):
-            return b.properties_in[0].pressure == b.properties_waste[0].pressure
+            return prop_in.pressure == prop_waste.pressure
 
         # Calculating chemical dosing
 
@@ -690,14 +684,12 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                 return b.CaO_dosing == pyunits.convert(
                     (
                         b.CO2_CaCO3
-                        + b.properties_in[0].conc_mass_phase_comp[
-                            "Liq", "Alkalinity_2-"
-                        ]
+                        + prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
                         + b.Mg_CaCO3
                     )
                     * b.CaO_mw
                     / b.CaCO3_mw
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.d,
                 )
 
@@ -706,14 +698,12 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                 co2_required_expr = (
                     pyunits.convert(
                         (
-                            b.properties_in[0].conc_mass_phase_comp[
-                                "Liq", "Alkalinity_2-"
-                            ]
+                            prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
                             - b.Ca_CaCO3
-                            + b.properties_out[0].conc_mass_phase_comp["Liq", "Ca_2+"]
+                            + prop_out.conc_mass_phase_comp["Liq", "Ca_2+"]
                             * b.Ca_CaCO3_conv
                         )
-                        * b.properties_in[0].flow_vol_phase["Liq"],
+                        * prop_in.flow_vol_phase["Liq"],
                         to_units=pyunits.kg / pyunits.d,
                     )
                     * b.CO2_mw
@@ -737,9 +727,7 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                     b.excess_CaO
                     == (
                         b.CO2_CaCO3
-                        + b.properties_in[0].conc_mass_phase_comp[
-                            "Liq", "Alkalinity_2-"
-                        ]
+                        + prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
                         + b.Mg_CaCO3
                     )
                     * b.excess_CaO_coeff
@@ -750,13 +738,11 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                 return b.CaO_dosing == pyunits.convert(
                     (
                         b.CO2_CaCO3
-                        + b.properties_in[0].conc_mass_phase_comp[
-                            "Liq", "Alkalinity_2-"
-                        ]
+                        + prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
                         + b.Mg_CaCO3
                         + b.excess_CaO
                     )
-                    * b.properties_in[0].flow_vol_phase["Liq"]
+                    * prop_in.flow_vol_phase["Liq"]
                     * b.CaO_mw
                     / b.CaCO3_mw,
                     to_units=pyunits.kg / pyunits.d,
@@ -766,15 +752,15 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
             def eq_CO2_first_basin(b):
                 co2_required_expr = pyunits.convert(
                     (
-                        b.properties_in[0].conc_mass_phase_comp["Liq", "Alkalinity_2-"]
+                        prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
                         - b.total_hardness
                         + b.excess_CaO
-                        + b.properties_out[0].conc_mass_phase_comp["Liq", "Ca_2+"]
+                        + prop_out.conc_mass_phase_comp["Liq", "Ca_2+"]
                         * b.Ca_CaCO3_conv
-                        + b.properties_out[0].conc_mass_phase_comp["Liq", "Mg_2+"]
+                        + prop_out.conc_mass_phase_comp["Liq", "Mg_2+"]
                         * b.Mg_CaCO3_conv
                     )
-                    * b.properties_in[0].flow_vol_phase["Liq"]
+                    * prop_in.flow_vol_phase["Liq"]
                     * b.CO2_mw
                     / b.CaCO3_mw,
                     to_units=pyunits.kg / pyunits.d,
@@ -795,14 +781,12 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                 return b.CaO_dosing == pyunits.convert(
                     (
                         b.CO2_CaCO3
-                        + b.properties_in[0].conc_mass_phase_comp[
-                            "Liq", "Alkalinity_2-"
-                        ]
+                        + prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
                         + b.Mg_CaCO3
                     )
                     * b.CaO_mw
                     / b.CaCO3_mw
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.d,
                 )
 
@@ -812,7 +796,7 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                     b.noncarbonate_hardness
                     * b.Na2CO3_mw
                     / b.CaCO3_mw
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.d,
                 )
 
@@ -820,15 +804,15 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
             def eq_CO2_first_basin(b):
                 co2_required_expr = pyunits.convert(
                     (
-                        b.properties_in[0].conc_mass_phase_comp["Liq", "Alkalinity_2-"]
+                        prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
                         + b.noncarbonate_hardness
                         - b.Ca_CaCO3
-                        + b.properties_out[0].conc_mass_phase_comp["Liq", "Ca_2+"]
+                        + prop_out.conc_mass_phase_comp["Liq", "Ca_2+"]
                         * b.Ca_CaCO3_conv
                     )
                     * b.CO2_mw
                     / b.CaCO3_mw
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.d,
                 )
                 return b.CO2_first_basin == Expr_if(
@@ -848,9 +832,7 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                     b.excess_CaO
                     == (
                         b.CO2_CaCO3
-                        + b.properties_in[0].conc_mass_phase_comp[
-                            "Liq", "Alkalinity_2-"
-                        ]
+                        + prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
                         + b.Mg_CaCO3
                     )
                     * b.excess_CaO_coeff
@@ -861,15 +843,13 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                 return b.CaO_dosing == pyunits.convert(
                     (
                         b.CO2_CaCO3
-                        + b.properties_in[0].conc_mass_phase_comp[
-                            "Liq", "Alkalinity_2-"
-                        ]
+                        + prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
                         + b.Mg_CaCO3
                         + b.excess_CaO
                     )
                     * b.CaO_mw
                     / b.CaCO3_mw
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.d,
                 )
 
@@ -879,7 +859,7 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                     b.noncarbonate_hardness
                     * b.Na2CO3_mw
                     / b.CaCO3_mw
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.d,
                 )
 
@@ -888,12 +868,12 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                 co2_required_expr = pyunits.convert(
                     (
                         b.excess_CaO
-                        + b.properties_out[0].conc_mass_phase_comp["Liq", "Mg_2+"]
+                        + prop_out.conc_mass_phase_comp["Liq", "Mg_2+"]
                         * b.Mg_CaCO3_conv
                     )
                     * b.CO2_mw
                     / b.CaCO3_mw
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.d,
                 )
                 return b.CO2_first_basin == Expr_if(
@@ -906,17 +886,17 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
             def eq_CO2_second_basin(b):
                 return b.CO2_second_basin == pyunits.convert(
                     (
-                        b.properties_in[0].conc_mass_phase_comp["Liq", "Alkalinity_2-"]
+                        prop_in.conc_mass_phase_comp["Liq", "Alkalinity_2-"]
                         + b.noncarbonate_hardness
                         - b.total_hardness
-                        + b.properties_out[0].conc_mass_phase_comp["Liq", "Ca_2+"]
+                        + prop_out.conc_mass_phase_comp["Liq", "Ca_2+"]
                         * b.Ca_CaCO3_conv
-                        + b.properties_out[0].conc_mass_phase_comp["Liq", "Mg_2+"]
+                        + prop_out.conc_mass_phase_comp["Liq", "Mg_2+"]
                         * b.Mg_CaCO3_conv
                     )
                     * b.CO2_mw
                     / b.CaCO3_mw
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.d,
                 )
 
@@ -927,13 +907,12 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                 return Expr_if(
                     (
                         (
-                            b.properties_in[0].conc_mass_phase_comp["Liq", "SiO2"]
+                            prop_in.conc_mass_phase_comp["Liq", "SiO2"]
                             * b.SiO2_check_conv
-                            > b.properties_in[0].conc_mass_phase_comp["Liq", "Mg_2+"]
+                            > prop_in.conc_mass_phase_comp["Liq", "Mg_2+"]
                         )
                     ),
-                    b.MgCl2_SiO2_ratio
-                    * b.properties_in[0].conc_mass_phase_comp["Liq", "SiO2"],
+                    b.MgCl2_SiO2_ratio * prop_in.conc_mass_phase_comp["Liq", "SiO2"],
                     1e-15 * pyunits.kg / pyunits.m**3,
                 )
 
@@ -952,79 +931,71 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
         @self.Constraint(doc="Water recovery")
         def eq_water_recovery(b):
             return (
-                b.properties_out[0].flow_mass_phase_comp["Liq", "H2O"]
-                == b.properties_in[0].flow_mass_phase_comp["Liq", "H2O"]
+                prop_out.flow_mass_phase_comp["Liq", "H2O"]
+                == prop_in.flow_mass_phase_comp["Liq", "H2O"]
                 * b.frac_mass_water_recovery
             )
 
         @self.Constraint(doc="Water mass balance")
         def eq_water_mass_balance(b):
             return (
-                b.properties_in[0].flow_mass_phase_comp["Liq", "H2O"]
-                == b.properties_out[0].flow_mass_phase_comp["Liq", "H2O"]
-                + b.properties_waste[0].flow_mass_phase_comp["Liq", "H2O"]
+                prop_in.flow_mass_phase_comp["Liq", "H2O"]
+                == prop_out.flow_mass_phase_comp["Liq", "H2O"]
+                + prop_waste.flow_mass_phase_comp["Liq", "H2O"]
             )
 
         @self.Constraint(non_hardness_comps, doc="Non-hardness component mass balance")
         def eq_non_hardness_comp_mass_balance(b, j):
             return (
-                b.properties_in[0].flow_mass_phase_comp["Liq", j]
-                == b.properties_out[0].flow_mass_phase_comp["Liq", j]
-                + b.properties_waste[0].flow_mass_phase_comp["Liq", j]
+                prop_in.flow_mass_phase_comp["Liq", j]
+                == prop_out.flow_mass_phase_comp["Liq", j]
+                + prop_waste.flow_mass_phase_comp["Liq", j]
             )
 
         @self.Constraint(non_hardness_comps, doc="Non-hardness component Removal")
         def eq_non_hardness_comp_removal(b, j):
-            return b.properties_out[0].flow_mass_phase_comp[
+            return prop_out.flow_mass_phase_comp[
                 "Liq", j
-            ] == b.properties_in[0].flow_mass_phase_comp["Liq", j] * (
-                1 - b.removal_efficiency[j]
-            )
+            ] == prop_in.flow_mass_phase_comp["Liq", j] * (1 - b.removal_efficiency[j])
 
         @self.Constraint(doc="Ca in effluent")
         def eq_effluent_ca(b):
-            return b.properties_out[0].flow_mass_phase_comp[
-                "Liq", "Ca_2+"
-            ] == pyunits.convert(
-                b.ca_eff_target * b.properties_out[0].flow_vol_phase["Liq"],
+            return prop_out.flow_mass_phase_comp["Liq", "Ca_2+"] == pyunits.convert(
+                b.ca_eff_target * prop_out.flow_vol_phase["Liq"],
                 to_units=pyunits.kg / pyunits.s,
             )
 
         @self.Constraint(doc="Ca mass balance")
         def eq_mass_balance_ca(b):
             return (
-                b.properties_waste[0].flow_mass_phase_comp["Liq", "Ca_2+"]
-                == b.properties_in[0].flow_mass_phase_comp["Liq", "Ca_2+"]
+                prop_waste.flow_mass_phase_comp["Liq", "Ca_2+"]
+                == prop_in.flow_mass_phase_comp["Liq", "Ca_2+"]
                 + pyunits.convert(
                     b.excess_CaO
                     * (b.Ca_mw / b.CaCO3_mw)
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.s,
                 )
-                - b.properties_out[0].flow_mass_phase_comp["Liq", "Ca_2+"]
+                - prop_out.flow_mass_phase_comp["Liq", "Ca_2+"]
             )
 
         @self.Constraint(doc="Mg in effluent")
         def eq_effluent_mg(b):
-            return b.properties_out[0].flow_mass_phase_comp[
-                "Liq", "Mg_2+"
-            ] == pyunits.convert(
-                (b.mg_eff_target * b.properties_out[0].flow_vol_phase["Liq"]),
+            return prop_out.flow_mass_phase_comp["Liq", "Mg_2+"] == pyunits.convert(
+                (b.mg_eff_target * prop_out.flow_vol_phase["Liq"]),
                 to_units=pyunits.kg / pyunits.s,
             )
 
         @self.Constraint(doc="Mg mass balance")
         def eq_mass_balance_mg(b):
-            return b.properties_waste[0].flow_mass_phase_comp[
-                "Liq", "Mg_2+"
-            ] == b.properties_in[0].flow_mass_phase_comp[
+            return prop_waste.flow_mass_phase_comp[
                 "Liq", "Mg_2+"
-            ] - b.properties_out[
+            ] == prop_in.flow_mass_phase_comp["Liq", "Mg_2+"] - b.properties_out[
                 0
             ].flow_mass_phase_comp[
                 "Liq", "Mg_2+"
             ] + pyunits.convert(
-                (b.MgCl2_dosing * b.properties_out[0].flow_vol_phase["Liq"]),
+                (b.MgCl2_dosing * prop_out.flow_vol_phase["Liq"]),
                 to_units=pyunits.kg / pyunits.s,
             )
 
@@ -1042,12 +1013,12 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                         + b.Mg_noncarbonate_hardness_sludge_factor
                         * b.Mg_noncarbonate_hardness_CaCO3
                         + b.excess_CaO
-                        + b.properties_in[0].conc_mass_phase_comp["Liq", "TSS"]
+                        + prop_in.conc_mass_phase_comp["Liq", "TSS"]
                         + b.MgCl2_dosing
                         * b.MgOH2_mw
                         / b.Mg_mw  # to convert to Mg(OH)2 solid
                     )
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.s,
                 )
 
@@ -1069,35 +1040,35 @@ class ChemicalSofteningData(InitializationMixin, UnitModelBlockData):
                         * b.MgOH2_mw
                         / b.Mg_mw  # to convert to Mg(OH)2 solid
                     )
-                    * b.properties_in[0].flow_vol_phase["Liq"],
+                    * prop_in.flow_vol_phase["Liq"],
                     to_units=pyunits.kg / pyunits.s,
                 )
 
         @self.Constraint(doc="Volume of mixer")
         def eq_volume_mixer(b):
             return b.volume_mixer == pyunits.convert(
-                b.properties_in[0].flow_vol_phase["Liq"] * b.retention_time_mixer,
+                prop_in.flow_vol_phase["Liq"] * b.retention_time_mixer,
                 to_units=pyunits.m**3,
             )
 
         @self.Constraint(doc="Volume of flocculator")
         def eq_volume_floc(b):
             return b.volume_floc == pyunits.convert(
-                b.properties_in[0].flow_vol_phase["Liq"] * b.retention_time_floc,
+                prop_in.flow_vol_phase["Liq"] * b.retention_time_floc,
                 to_units=pyunits.m**3,
             )
 
         @self.Constraint(doc="Volume of sedimentation basin")
         def eq_volume_sed(b):
             return b.volume_sed == pyunits.convert(
-                b.properties_in[0].flow_vol_phase["Liq"] * b.retention_time_sed,
+                prop_in.flow_vol_phase["Liq"] * b.retention_time_sed,
                 to_units=pyunits.m**3,
             )
 
         @self.Constraint(doc="Volume of recarbonation basin")
         def eq_volume_recarb(b):
             return b.volume_recarb == pyunits.convert(
-                b.properties_in[0].flow_vol_phase["Liq"] * b.retention_time_recarb,
+                prop_in.flow_vol_phase["Liq"] * b.retention_time_recarb,
                 to_units=pyunits.m**3,
             )
 
@@ -114,22 +114,20 @@ class SolarStillData(InitializationMixin, UnitModelBlockData):
 
         self.scaling_factor = Suffix(direction=Suffix.EXPORT)
         unit_log = idaeslog.getModelLogger(self.name, tag="unit")
+        water_yield_args = self.config.water_yield_calculation_args
 
-        if len(self.config.water_yield_calculation_args) > 0:
+        if len(water_yield_args) > 0:
             required_args = [
                 "input_weather_file_path",
                 "initial_salinity",
                 "initial_water_depth",
                 "length_basin",
             ]
-            if not all(
-                a in self.config.water_yield_calculation_args.keys()
-                for a in required_args
-            ):
+            if not all(a in water_yield_args.keys() for a in required_args):
                 raise ConfigurationError(
                     f'Water yield calculation dict must contain values for "input_weather_file_path", "initial_salinity", '
                     f'"initial_water_depth", and "length_basin", but '
-                    f"{[*self.config.water_yield_calculation_args.keys()]}  were found."
+                    f"{[*water_yield_args.keys()]}  were found."
                 )
 
         tmp_dict = dict(**self.config.property_package_args)
@@ -182,20 +180,18 @@ class SolarStillData(InitializationMixin, UnitModelBlockData):
             doc="Dimension of one side of solar still",
         )
 
-        if self.config.water_yield_calculation_args != {}:
+        if water_yield_args != {}:
 
             unit_log.info(
                 f"Found water yield calculation arguments in {self.name} configuration."
             )
             unit_log.info(
-                f"Calculating daily water yield assuming initial salinity {self.config.water_yield_calculation_args['initial_salinity']}"
-                f" g/L TDS with {self.config.water_yield_calculation_args['initial_water_depth']} m initial water depth."
+                f"Calculating daily water yield assuming initial salinity {water_yield_args['initial_salinity']}"
+                f" g/L TDS with {water_yield_args['initial_water_depth']} m initial water depth."
             )
 
             daily_water_yield_mass, num_zld_cycles_per_year = (
-                self.calculate_daily_water_yield(
-                    **self.config.water_yield_calculation_args
-                )
+                self.calculate_daily_water_yield(**water_yield_args)
             )
 
             unit_log.info(
@@ -204,9 +200,7 @@ class SolarStillData(InitializationMixin, UnitModelBlockData):
 
             self.water_yield.set_value(daily_water_yield_mass)
             self.number_zld_cycles.set_value(num_zld_cycles_per_year)
-            self.length_basin.set_value(
-                self.config.water_yield_calculation_args["length_basin"]
-            )
+            self.length_basin.set_value(water_yield_args["length_basin"])
 
         else:
 
@@ -241,10 +235,7 @@ class SolarStillData(InitializationMixin, UnitModelBlockData):
         @self.Expression(doc="Annual water yield per unit area")
         def annual_water_yield(b):
             return pyunits.convert(
-                b.water_yield
-                / b.properties_in[0].dens_mass_phase["Liq"]
-                * 365
-                * pyunits.day,
+                b.water_yield / prop_in.dens_mass_phase["Liq"] * 365 * pyunits.day,
                 to_units=pyunits.m**3 / pyunits.m**2,
             )
 
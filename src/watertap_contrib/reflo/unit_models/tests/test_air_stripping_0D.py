@@ -11,6 +11,7 @@
 #################################################################################
 
 import pytest
+import numpy as np
 from pyomo.environ import (
     ConcreteModel,
     Set,
@@ -24,11 +25,12 @@ from pyomo.environ import (
 from pyomo.network import Port
 
 from idaes.core import (
+    FlowsheetBlock,
+    UnitModelCostingBlock,
     MaterialBalanceType,
     EnergyBalanceType,
     MomentumBalanceType,
 )
-from idaes.core import FlowsheetBlock, UnitModelCostingBlock
 from idaes.core.util.testing import initialization_tester
 from idaes.core.util.model_statistics import (
     degrees_of_freedom,
@@ -57,6 +59,176 @@ from watertap_contrib.reflo.unit_models.air_stripping_0D import (
 solver = get_solver()
 
 
+def _assert_results(blk, results, rel=1e-3):
+    """
+    Check the values of the components on blk named in results
+    against the expected values in one pytest.approx comparison.
+    Indexed components are given as a dict of index: value.
+    """
+    expected = {}
+    actual = {}
+    for v, r in results.items():
+        c = getattr(blk, v)
+        if isinstance(r, dict):
+            for i, s in r.items():
+                expected[f"{v}[{i}]"] = s
+                actual[f"{v}[{i}]"] = value(c[i])
+        else:
+            expected[v] = r
+            actual[v] = value(c)
+
+    assert actual == pytest.approx(expected, rel=rel)
+
+
+ax_results1 = {
+    "blower_power": 2.239159,
+    "pump_power": 19.33556,
+    "packing_surface_area_total": 242.0,
+    "packing_surface_area_wetted": 147.561,
+    "packing_diam_nominal": 0.0889,
+    "packing_factor": 33.0,
+    "packing_surf_tension": 0.033,
+    "surf_tension_water": 0.0735,
+    "stripping_factor": {"TCA": 3.394407},
+    "air_water_ratio_min": 2.000348,
+    "packing_height": 8.841,
+    "mass_loading_rate": {"Liq": 39.15, "Vap": 0.334627822},
+    "height_transfer_unit": {"TCA": 1.967472},
+    "number_transfer_unit": {"TCA": 4.49394},
+    "pressure_drop_gradient": 75.0,
+    "overall_mass_transfer_coeff": {"TCA": 0.019915699},
+    "oto_E": 0.611802769,
+    "oto_F": 1.875061,
+    "oto_a0": -2.279915,
+    "oto_a1": -0.729372463,
+    "oto_a2": -0.228704898,
+    "oto_M": 0.00154258,
+    "oto_mass_transfer_coeff": {
+        ("Liq", "TCA"): 0.00036455,
+        ("Vap", "TCA"): 0.000842984,
+    },
+    "air_water_ratio_op": 6.999,
+    "packing_efficiency_number": 21.513,
+    "tower_area": 4.0323,
+    "tower_diam": 2.265851,
+    "tower_height": 10.61,
+    "tower_volume": 42.782,
+    "packing_volume": 35.652,
+    "target_remaining_frac": {"TCA": 0.03},
+    "pressure_drop": 795.753,
+    "pressure_drop_tower": 20.688,
+    "N_Sc": {("Liq", "TCA"): 1622.798, ("Vap", "TCA"): 1.8083},
+    "N_Re": 140.676,
+    "N_Fr": 0.037888131,
+    "N_We": 0.086245507,
+    "oto_kl_term": 88595.604,
+}
+
+ax_costing_results1 = {
+    "capital_cost": 391313.521,
+    "tower_cost": 20201.182,
+    "port_cost": 643.059,
+    "piping_liq_cost": 2189.254,
+    "piping_air_cost": 2298.717,
+    "tray_ring_cost": 1185.632,
+    "distributor_cost": 3584.056,
+    "plate_cost": 1745.286,
+    "tower_internals_cost": 5329.343,
+    "packing_cost": 252197.627,
+    "mist_eliminator_cost": 3899.822,
+    "pump_cost": 42038.547,
+    "blower_cost": 61305.385,
+    "electricity_flow": 21.562,
+}
+
+m_costing_results1 = {
+    "aggregate_capital_cost": 391313.521,
+    "aggregate_fixed_operating_cost": 0.0,
+    "aggregate_variable_operating_cost": 0.0,
+    "aggregate_flow_electricity": 21.56,
+    "aggregate_flow_costs": {"electricity": 15532.43},
+    "total_capital_cost": 391313.521,
+    "maintenance_labor_chemical_operating_cost": 11739.41,
+    "total_operating_cost": 27280.755,
+    "LCOW": 0.0142577,
+    "SEC": 0.03793025,
+}
+
+ax_results2 = {
+    "blower_power": 11.475,
+    "pump_power": 16.365,
+    "packing_surface_area_total": 125.0,
+    "packing_surface_area_wetted": 56.766,
+    "packing_diam_nominal": 0.0889,
+    "packing_factor": 39.0,
+    "packing_surf_tension": 0.033,
+    "surf_tension_water": 0.0742,
+    "stripping_factor": {"DCP": 4.503699},
+    "air_water_ratio_min": 11.99,
+    "packing_height": 11.824,
+    "mass_loading_rate": {"Liq": 7.7, "Vap": 0.5763451},
+    "height_transfer_unit": {"DCP": 4.423251},
+    "number_transfer_unit": {"DCP": 2.673204},
+    "pressure_drop_gradient": 50.0,
+    "overall_mass_transfer_coeff": {"DCP": 0.0017415},
+    "oto_E": -0.325878163,
+    "oto_F": 1.69897,
+    "oto_a0": -2.457618,
+    "oto_a1": -0.633128697,
+    "oto_a2": -0.186834171,
+    "oto_M": 0.00535628,
+    "oto_mass_transfer_coeff": {
+        ("Liq", "DCP"): 0.000162215,
+        ("Vap", "DCP"): 0.000800008,
+    },
+    "air_water_ratio_op": 59.999,
+    "packing_efficiency_number": 11.112,
+    "tower_area": 12.981,
+    "tower_diam": 4.06558,
+    "tower_height": 14.189,
+    "tower_volume": 184.2,
+    "packing_volume": 153.5,
+    "target_remaining_frac": {"DCP": 0.099999999},
+    "pressure_drop": 709.455,
+    "pressure_drop_tower": 58.744,
+    "N_Sc": {("Liq", "DCP"): 1813.198, ("Vap", "DCP"): 1.673158},
+    "N_Re": 47.135,
+    "N_Fr": 0.000756345,
+    "N_We": 0.006395675,
+    "oto_kl_term": 77996.197,
+}
+
+ax_costing_results2 = {
+    "capital_cost": 1414661.385,
+    "tower_cost": 37232.248,
+    "port_cost": 643.059,
+    "piping_liq_cost": 2189.254,
+    "piping_air_cost": 2298.717,
+    "tray_ring_cost": 2402.264,
+    "distributor_cost": 10295.84,
+    "plate_cost": 5255.23,
+    "tower_internals_cost": 15551.071,
+    "packing_cost": 1085202.793,
+    "mist_eliminator_cost": 10036.566,
+    "pump_cost": 38366.194,
+    "blower_cost": 220739.214,
+    "electricity_flow": 27.84,
+}
+
+m_costing_results2 = {
+    "aggregate_capital_cost": 1414661.385,
+    "aggregate_fixed_operating_cost": 0.0,
+    "aggregate_variable_operating_cost": 0.0,
+    "aggregate_flow_electricity": 27.84,
+    "aggregate_flow_costs": {"electricity": 20054.989},
+    "total_capital_cost": 1414661.385,
+    "maintenance_labor_chemical_operating_cost": 42439.841,
+    "total_operating_cost": 62494.830,
+    "LCOW": 0.0699909,
+    "SEC": 0.077335064,
+}
+
+
 class TestAirStripping0D:
     @pytest.fixture(scope="class")
     def ax_frame1(self):
@@ -83,18 +255,14 @@ class TestAirStripping0D:
         prop_in = ax.process_flow.properties_in[0]
         prop_out = ax.process_flow.properties_out[0]
 
-        m.fs.properties.set_default_scaling(
-            "flow_mass_phase_comp", 0.0063345, index=("Liq", "H2O")
-        )
-        m.fs.properties.set_default_scaling(
-            "flow_mass_phase_comp", 38358.266, index=("Liq", target)
-        )
-        m.fs.properties.set_default_scaling(
-            "flow_mass_phase_comp", 1, index=("Vap", target)
-        )
-        m.fs.properties.set_default_scaling(
-            "flow_mass_phase_comp", 0.741114, index=("Vap", "Air")
-        )
+        flow_mass_sf = {
+            ("Liq", "H2O"): 0.0063345,
+            ("Liq", target): 38358.266,
+            ("Vap", target): 1,
+            ("Vap", "Air"): 0.741114,
+        }
+        for pj, sf in flow_mass_sf.items():
+            m.fs.properties.set_default_scaling("flow_mass_phase_comp", sf, index=pj)
         set_scaling_factor(prop_out.flow_mass_phase_comp["Vap", target], 1e6)
 
         prop_in.flow_mass_phase_comp["Liq", "H2O"].fix(157.8657)
@@ -163,8 +331,8 @@ class TestAirStripping0D:
         assert hasattr(ax, "build_oto")
 
         # test statistics
-        assert number_variables(m) == 86
-        assert number_total_constraints(m) == 64
+        assert number_variables(m) == 84
+        assert number_total_constraints(m) == 62
         assert number_unused_variables(m) == 1
 
         ax_params = [
@@ -250,6 +418,8 @@ class TestAirStripping0D:
             "target_remaining_frac",
             "pressure_drop",
             "pressure_drop_tower",
+            "blower_power",
+            "pump_power",
         ]
 
         for ename in ax_expr:
@@ -265,7 +435,7 @@ class TestAirStripping0D:
     def test_calculate_scaling1(self, ax_frame1):
         m = ax_frame1
 
-        calculate_scaling_factors(m)
+        calculate_scaling_factors(m.fs.ax)
         unscaled_var_list = list(unscaled_variables_generator(m))
         assert len(unscaled_var_list) == 0
 
@@ -287,81 +457,36 @@ class TestAirStripping0D:
         prop_in = ax.process_flow.properties_in[0]
         prop_out = ax.process_flow.properties_out[0]
 
-        assert pytest.approx(
-            sum(
-                value(prop_in.flow_mass_phase_comp[p, ax.config.target])
+        target = ax.config.target
+        flow_in = np.array(
+            [
+                value(prop_in.flow_mass_phase_comp[p, target])
                 for p in m.fs.properties.phase_list
-            ),
-            rel=1e-5,
-        ) == sum(
-            value(prop_out.flow_mass_phase_comp[p, ax.config.target])
-            for p in m.fs.properties.phase_list
+            ]
         )
-
-        assert value(prop_in.flow_mass_phase_comp["Liq", "H2O"]) == value(
-            prop_out.flow_mass_phase_comp["Liq", "H2O"]
+        flow_out = np.array(
+            [
+                value(prop_out.flow_mass_phase_comp[p, target])
+                for p in m.fs.properties.phase_list
+            ]
         )
+        assert flow_out.sum() == pytest.approx(flow_in.sum(), rel=1e-5)
 
-        assert value(prop_in.flow_mass_phase_comp["Vap", "Air"]) == value(
-            prop_out.flow_mass_phase_comp["Vap", "Air"]
-        )
+        # carrier water and air pass through the unit unchanged
+        for pj in [("Liq", "H2O"), ("Vap", "Air")]:
+            assert np.isclose(
+                value(prop_out.flow_mass_phase_comp[pj]),
+                value(prop_in.flow_mass_phase_comp[pj]),
+                rtol=1e-8,
+                atol=0,
+            )
 
     @pytest.mark.component
     def test_solution1(self, ax_frame1):
         m = ax_frame1
         ax = m.fs.ax
 
-        ax_results = {
-            "blower_power": 2.239159,
-            "pump_power": 19.33556,
-            "packing_surface_area_total": 242.0,
-            "packing_surface_area_wetted": 147.561,
-            "packing_diam_nominal": 0.0889,
-            "packing_factor": 33.0,
-            "packing_surf_tension": 0.033,
-            "surf_tension_water": 0.0735,
-            "stripping_factor": {"TCA": 3.394407},
-            "air_water_ratio_min": 2.000348,
-            "packing_height": 8.841,
-            "mass_loading_rate": {"Liq": 39.15, "Vap": 0.334627822},
-            "height_transfer_unit": {"TCA": 1.967472},
-            "number_transfer_unit": {"TCA": 4.49394},
-            "pressure_drop_gradient": 75.0,
-            "overall_mass_transfer_coeff": {"TCA": 0.019915699},
-            "oto_E": 0.611802769,
-            "oto_F": 1.875061,
-            "oto_a0": -2.279915,
-            "oto_a1": -0.729372463,
-            "oto_a2": -0.228704898,
-            "oto_M": 0.00154258,
-            "oto_mass_transfer_coeff": {
-                ("Liq", "TCA"): 0.00036455,
-                ("Vap", "TCA"): 0.000842984,
-            },
-            "air_water_ratio_op": 6.999,
-            "packing_efficiency_number": 21.513,
-            "tower_area": 4.0323,
-            "tower_diam": 2.265851,
-            "tower_height": 10.61,
-            "tower_volume": 42.782,
-            "packing_volume": 35.652,
-            "target_remaining_frac": {"TCA": 0.03},
-            "pressure_drop": 795.753,
-            "pressure_drop_tower": 20.688,
-            "N_Sc": {("Liq", "TCA"): 1622.798, ("Vap", "TCA"): 1.8083},
-            "N_Re": 140.676,
-            "N_Fr": 0.037888131,
-            "N_We": 0.086245507,
-            "oto_kl_term": 88595.604,
-        }
-
-        for v, r in ax_results.items():
-            axv = getattr(ax, v)
-            if isinstance(r, dict):
-                for i, s in r.items():
-                    assert value(axv[i]) == pytest.approx(s, rel=1e-3)
-            else:
-                assert value(axv) == pytest.approx(r, rel=1e-3)
+        _assert_results(ax, ax_results1)
 
     @pytest.mark.component
     def test_costing1(self, ax_frame1):
@@ -388,47 +513,8 @@ class TestAirStripping0D:
         results = solver.solve(m)
         assert_optimal_termination(results)
 
-        ax_costing_results = {
-            "capital_cost": 391313.521,
-            "tower_cost": 20201.182,
-            "port_cost": 643.059,
-            "piping_liq_cost": 2189.254,
-            "piping_air_cost": 2298.717,
-            "tray_ring_cost": 1185.632,
-            "distributor_cost": 3584.056,
-            "plate_cost": 1745.286,
-            "tower_internals_cost": 5329.343,
-            "packing_cost": 252197.627,
-            "mist_eliminator_cost": 3899.822,
-            "pump_cost": 42038.547,
-            "blower_cost": 61305.385,
-            "electricity_flow": 21.562,
-        }
-
-        for v, r in ax_costing_results.items():
-            axc = getattr(ax.costing, v)
-            assert value(axc) == pytest.approx(r, rel=1e-3)
-
-        m_costing_results = {
-            "aggregate_capital_cost": 391313.521,
-            "aggregate_fixed_operating_cost": 0.0,
-            "aggregate_variable_operating_cost": 0.0,
-            "aggregate_flow_electricity": 21.56,
-            "aggregate_flow_costs": {"electricity": 15532.43},
-            "total_capital_cost": 391313.521,
-            "maintenance_labor_chemical_operating_cost": 11739.41,
-            "total_operating_cost": 27280.755,
-            "LCOW": 0.0142577,
-            "SEC": 0.03793025,
-        }
-
-        for v, r in m_costing_results.items():
-            mc = getattr(m.fs.costing, v)
-            if isinstance(r, dict):
-                for i, s in r.items():
-                    assert value(mc[i]) == pytest.approx(s, rel=1e-3)
-            else:
-                assert value(mc) == pytest.approx(r, rel=1e-3)
+        _assert_results(ax.costing, ax_costing_results1)
+        _assert_results(m.fs.costing, m_costing_results1)
 
     @pytest.fixture(scope="class")
     def ax_frame2(self):
@@ -455,18 +541,14 @@ class TestAirStripping0D:
         prop_in = ax.process_flow.properties_in[0]
         prop_out = ax.process_flow.properties_out[0]
 
-        m.fs.properties.set_default_scaling(
-            "flow_mass_phase_comp", 0.01, index=("Liq", "H2O")
-        )
-        m.fs.properties.set_default_scaling(
-            "flow_mass_phase_comp", 1e4, index=("Liq", target)
-        )
-        m.fs.properties.set_default_scaling(
-            "flow_mass_phase_comp", 1, index=("Vap", target)
-        )
-        m.fs.properties.set_default_scaling(
-            "flow_mass_phase_comp", 0.133654, index=("Vap", "Air")
-        )
+        flow_mass_sf = {
+            ("Liq", "H2O"): 0.01,
+            ("Liq", target): 1e4,
+            ("Vap", target): 1,
+            ("Vap", "Air"): 0.133654,
+        }
+        for pj, sf in flow_mass_sf.items():
+            m.fs.properties.set_default_scaling("flow_mass_phase_comp", sf, index=pj)
         set_scaling_factor(prop_out.flow_mass_phase_comp["Vap", target], 1e6)
 
         prop_in.flow_mass_phase_comp["Liq", "H2O"].fix(99.97)
@@ -535,8 +617,8 @@ class TestAirStripping0D:
         assert hasattr(ax, "build_oto")
 
         # test statistics
-        assert number_variables(m) == 86
-        assert number_total_constraints(m) == 64
+        assert number_variables(m) == 84
+        assert number_total_constraints(m) == 62
         assert number_unused_variables(m) == 1
 
         ax_params = [
@@ -584,8 +666,6 @@ class TestAirStripping0D:
             assert isinstance(getattr(ax, pname), Param)
 
         ax_vars = [
-            "blower_power",
-            "pump_power",
             "packing_surface_area_total",
             "packing_surface_area_wetted",
             "packing_diam_nominal",
@@ -624,6 +704,8 @@ class TestAirStripping0D:
             "target_remaining_frac",
             "pressure_drop",
             "pressure_drop_tower",
+            "blower_power",
+            "pump_power",
         ]
 
         for ename in ax_expr:
@@ -639,7 +721,7 @@ class TestAirStripping0D:
     def test_calculate_scaling2(self, ax_frame2):
         m = ax_frame2
 
-        calculate_scaling_factors(m)
+        calculate_scaling_factors(m.fs.ax)
         unscaled_var_list = list(unscaled_variables_generator(m))
         assert len(unscaled_var_list) == 0
 
@@ -661,81 +743,36 @@ class TestAirStripping0D:
         prop_in = ax.process_flow.properties_in[0]
         prop_out = ax.process_flow.properties_out[0]
 
-        assert pytest.approx(
-            sum(
-                value(prop_in.flow_mass_phase_comp[p, ax.config.target])
+        target = ax.config.target
+        flow_in = np.array(
+            [
+                value(prop_in.flow_mass_phase_comp[p, target])
                 for p in m.fs.properties.phase_list
-            ),
-            rel=1e-5,
-        ) == sum(
-            value(prop_out.flow_mass_phase_comp[p, ax.config.target])
-            for p in m.fs.properties.phase_list
+            ]
         )
-
-        assert value(prop_in.flow_mass_phase_comp["Liq", "H2O"]) == value(
-            prop_out.flow_mass_phase_comp["Liq", "H2O"]
+        flow_out = np.array(
+            [
+                value(prop_out.flow_mass_phase_comp[p, target])
+                for p in m.fs.properties.phase_list
+            ]
         )
+        assert flow_out.sum() == pytest.approx(flow_in.sum(), rel=1e-5)
 
-        assert value(prop_in.flow_mass_phase_comp["Vap", "Air"]) == value(
-            prop_out.flow_mass_phase_comp["Vap", "Air"]
-        )
+        # carrier water and air pass through the unit unchanged
+        for pj in [("Liq", "H2O"), ("Vap", "Air")]:
+            assert np.isclose(
+                value(prop_out.flow_mass_phase_comp[pj]),
+                value(prop_in.flow_mass_phase_comp[pj]),
+                rtol=1e-8,
+                atol=0,
+            )
 
     @pytest.mark.component
     def test_solution2(self, ax_frame2):
         m = ax_frame2
         ax = m.fs.ax
 
-        ax_results = {
-            "blower_power": 11.475,
-            "pump_power": 16.365,
-            "packing_surface_area_total": 125.0,
-            "packing_surface_area_wetted": 56.766,
-            "packing_diam_nominal": 0.0889,
-            "packing_factor": 39.0,
-            "packing_surf_tension": 0.033,
-            "surf_tension_water": 0.0742,
-            "stripping_factor": {"DCP": 4.503699},
-            "air_water_ratio_min": 11.99,
-            "packing_height": 11.824,
-            "mass_loading_rate": {"Liq": 7.7, "Vap": 0.5763451},
-            "height_transfer_unit": {"DCP": 4.423251},
-            "number_transfer_unit": {"DCP": 2.673204},
-            "pressure_drop_gradient": 50.0,
-            "overall_mass_transfer_coeff": {"DCP": 0.0017415},
-            "oto_E": -0.325878163,
-            "oto_F": 1.69897,
-            "oto_a0": -2.457618,
-            "oto_a1": -0.633128697,
-            "oto_a2": -0.186834171,
-            "oto_M": 0.00535628,
-            "oto_mass_transfer_coeff": {
-                ("Liq", "DCP"): 0.000162215,
-                ("Vap", "DCP"): 0.000800008,
-            },
-            "air_water_ratio_op": 59.999,
-            "packing_efficiency_number": 11.112,
-            "tower_area": 12.981,
-            "tower_diam": 4.06558,
-            "tower_height": 14.189,
-            "tower_volume": 184.2,
-            "packing_volume": 153.5,
-            "target_remaining_frac": {"DCP": 0.099999999},
-            "pressure_drop": 709.455,
-            "pressure_drop_tower": 58.744,
-            "N_Sc": {("Liq", "DCP"): 1813.198, ("Vap", "DCP"): 1.673158},
-            "N_Re": 47.135,
-            "N_Fr": 0.000756345,
-            "N_We": 0.006395675,
-            "oto_kl_term": 77996.197,
-        }
-
-        for v, r in ax_results.items():
-            axv = getattr(ax, v)
-            if isinstance(r, dict):
-                for i, s in r.items():
-                    assert value(axv[i]) == pytest.approx(s, rel=1e-3)
-            else:
-                assert value(axv) == pytest.approx(r, rel=1e-3)
+        _assert_results(ax, ax_results2)
 
     @pytest.mark.component
     def test_costing2(self, ax_frame2):
@@ -762,44 +799,5 @@ class TestAirStripping0D:
         results = solver.solve(m)
         assert_optimal_termination(results)
 
-        ax_costing_results = {
-            "capital_cost": 1414661.385,
-            "tower_cost": 37232.248,
-            "port_cost": 643.059,
-            "piping_liq_cost": 2189.254,
-            "piping_air_cost": 2298.717,
-            "tray_ring_cost": 2402.264,
-            "distributor_cost": 10295.84,
-            "plate_cost": 5255.23,
-            "tower_internals_cost": 15551.071,
-            "packing_cost": 1085202.793,
-            "mist_eliminator_cost": 10036.566,
-            "pump_cost": 38366.194,
-            "blower_cost": 220739.214,
-            "electricity_flow": 27.84,
-        }
-
-        for v, r in ax_costing_results.items():
-            axc = getattr(ax.costing, v)
-            assert value(axc) == pytest.approx(r, rel=1e-3)
-
-        m_costing_results = {
-            "aggregate_capital_cost": 1414661.385,
-            "aggregate_fixed_operating_cost": 0.0,
-            "aggregate_variable_operating_cost": 0.0,
-            "aggregate_flow_electricity": 27.84,
-            "aggregate_flow_costs": {"electricity": 20054.989},
-            "total_capital_cost": 1414661.385,
-            "maintenance_labor_chemical_operating_cost": 42439.841,
-            "total_operating_cost": 62494.830,
-            "LCOW": 0.0699909,
-            "SEC": 0.077335064,
-        }
-
-        for v, r in m_costing_results.items():
-            mc = getattr(m.fs.costing, v)
-            if isinstance(r, dict):
-                for i, s in r.items():
-                    assert value(mc[i]) == pytest.approx(s, rel=1e-3)
-            else:
-                assert value(mc) == pytest.approx(r, rel=1e-3)
+        _assert_results(ax.costing, ax_costing_results2)
+        _assert_results(m.fs.costing, m_costing_results2)
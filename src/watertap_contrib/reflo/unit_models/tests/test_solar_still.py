@@ -12,6 +12,7 @@
 
 import os
 import pytest
+import numpy as np
 
 from pyomo.environ import (
     ConcreteModel,
@@ -42,6 +43,15 @@ from watertap.property_models.multicomp_aq_sol_prop_pack import (
 )
 
 from watertap_contrib.reflo.unit_models import SolarStill
+from watertap_contrib.reflo.unit_models.util.water_yield_calculation import (
+    _read_weather_data,
+)
+from watertap_contrib.reflo.unit_models.util.sw_props import (
+    calculate_density,
+    calculate_viscosity,
+    calculate_specific_heat,
+    calculate_thermal_conductivity,
+)
 from watertap_contrib.reflo.costing import TreatmentCosting
 
 # Get default solver for testing
@@ -270,6 +280,37 @@ def test_input_data_too_short():
         )
 
 
+@pytest.mark.unit
+def test_weather_data_cache():
+    _read_weather_data.cache_clear()
+    cols = ("GHI", "Tdry", "Wspd")
+    mtime = os.path.getmtime(test_data_path)
+
+    df = _read_weather_data(test_data_path, mtime, cols)
+    assert list(df.columns) == list(cols)
+    assert len(df) == 8760
+
+    assert _read_weather_data(test_data_path, mtime, cols) is df
+    assert _read_weather_data.cache_info().hits == 1
+
+
+@pytest.mark.unit
+def test_sw_props_array_input():
+    salinity = np.array([0, 35, 120, 200, 365])
+    temperature = np.array([5, 20, 35, 50, 80])
+
+    for calc in [
+        calculate_density,
+        calculate_viscosity,
+        calculate_specific_heat,
+        calculate_thermal_conductivity,
+    ]:
+        props = calc(salinity, temperature)
+        assert props.shape == salinity.shape
+        for s, t, p in zip(salinity, temperature, props):
+            assert calc(float(s), float(t)) == pytest.approx(p, rel=1e-12)
+
+
 @pytest.mark.component
 def test_input_data_different_col_names():
 
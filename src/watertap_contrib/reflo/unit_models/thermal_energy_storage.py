@@ -116,9 +116,6 @@ class ThermalEnergyStorageData(UnitModelBlockData):
         )
 
         # Add hx outlet block
-        tmp_dict = dict(**self.config.property_package_args)
-        tmp_dict["has_phase_equilibrium"] = False
-        tmp_dict["parameters"] = self.config.property_package
         tmp_dict["defined_state"] = False  # block is not an inlet
         self.hx_outlet_block = self.config.property_package.state_block_class(
             self.flowsheet().config.time,
@@ -127,9 +124,6 @@ class ThermalEnergyStorageData(UnitModelBlockData):
         )
 
         # Add process inlet block
-        tmp_dict = dict(**self.config.property_package_args)
-        tmp_dict["has_phase_equilibrium"] = False
-        tmp_dict["parameters"] = self.config.property_package
         tmp_dict["defined_state"] = True
         self.process_inlet_block = self.config.property_package.state_block_class(
             self.flowsheet().config.time,
@@ -138,9 +132,6 @@ class ThermalEnergyStorageData(UnitModelBlockData):
         )
 
         # Add process outlet block
-        tmp_dict = dict(**self.config.property_package_args)
-        tmp_dict["has_phase_equilibrium"] = False
-        tmp_dict["parameters"] = self.config.property_package
         tmp_dict["defined_state"] = False  # block is not an inlet
         self.process_outlet_block = self.config.property_package.state_block_class(
             self.flowsheet().config.time,
@@ -11,11 +11,11 @@
 #################################################################################
 
 import math
-import pandas as pd
 import numpy as np
 
 """
-Utility functions to calculate various saltwater properties for Solar Still Model
+Utility functions to calculate various saltwater properties for Solar Still Model.
+Salinity and temperature can be scalars or broadcastable NumPy arrays.
 """
 
 
@@ -115,15 +115,20 @@ def calculate_thermal_conductivity(salinity, temperature):
     Accuracy of correlation is valid for up to 160 g/l.
     However, intuitive natural behaviour is reported for up to 350 g/l.
     """
-    saltwater_thermal_conductivity_coefficient_1 = math.log10(240 + 0.0002 * salinity)
+    if isinstance(salinity, np.ndarray):
+        saltwater_thermal_conductivity_coefficient_1 = np.log10(240 + 0.0002 * salinity)
+    else:
+        # math.log10 for scalars: NumPy's log10 can differ in the last bit,
+        # which shifts the end of the per-second solar still integration
+        saltwater_thermal_conductivity_coefficient_1 = math.log10(
+            240 + 0.0002 * salinity
+        )
     saltwater_thermal_conductivity_coefficient_2 = 0.434 * (
         2.3 - ((343.5 + (0.037 * salinity)) / ((temperature + 273)))
     )
     saltwater_thermal_conductivity_coefficient_3 = abs(
         1 - ((temperature + 273) / (647 + 0.03 * salinity))
     ) ** (1 / 3)
-    if saltwater_thermal_conductivity_coefficient_3 == "nan":  # Avoiding singularities
-        saltwater_thermal_conductivity_coefficient_3 = 1
 
     log_base_10_thermal_conductivity = saltwater_thermal_conductivity_coefficient_1 + (
         saltwater_thermal_conductivity_coefficient_2
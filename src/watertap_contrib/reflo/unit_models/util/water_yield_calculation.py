@@ -11,6 +11,9 @@
 #################################################################################
 
 import math
+import os
+from functools import lru_cache
+
 from pandas import read_csv
 import numpy as np
 
@@ -50,6 +53,12 @@ emissivity_water = 0.95 * 1.0  # Water Emissivity (-)
 # Effective emissivity of water to glass (-)
 emissivity_effective = 1 / ((1 / emissivity_water) + (1 / emissivity_glass) - 1)
 
+# Loop-invariant groupings used at every time step of the yield calculation
+rad_coeff_water = emissivity_water * stefan_boltzmann  # W / m2 / K4
+rad_coeff_glass = stefan_boltzmann * emissivity_glass  # W / m2 / K4
+conductance_glass = conductivity_glass / thickness_glass  # W / m2 / K
+resistance_insulation = thickness_insulation / conductivity_insulation  # m2.K / W
+
 # No Attenuation factor considered
 # Fraction of solar radiation absorbed by water (-)
 absorp_effective_water = (
@@ -69,12 +78,23 @@ absorp_effective_basin = (
 # Fraction of solar radiation absorbed by a glass cover (-)
 absorp_effective_glass = (1 - reflectivity_glass) * absorp_glass
 
+# Default weather data column names are those in files as downloaded from
+# https://sam.nrel.gov/weather-data.html
+default_irradiance_col = "GHI"  # W/m2
+default_temperature_col = "Tdry"  # °C
+default_wind_velocity_col = "Wspd"  # m/s
+
 # Adaptive coeff heat transfer coeff with buoyancy
 AA = 0.54
 # Power of nondimensional numbers for heat transfer coeff with buoyancy
 BB = 0.25
 
 
+@lru_cache(maxsize=8)
+def _read_weather_data(input_weather_file_path, mtime, weather_cols):
+    return read_csv(input_weather_file_path, skiprows=2, usecols=list(weather_cols))
+
+
 def create_input_arrays(
     blk,
     irradiance_threshold=0,  # blk.irradiance values < threshold assumed to have negligible impact on calculation; W/m2
@@ -85,57 +105,40 @@ def create_input_arrays(
 
     def generate_continuous_day_series():
         # Days in each month for non-leap year
-        days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+        days_in_month = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+        # Day of the year before the first of each month
+        days_before_month = np.cumsum(days_in_month) - days_in_month
 
-        continuous_day_series = []
-
-        for day in range(1, 32):  # up to 31 days to cover all months
-            for month_index, days in enumerate(days_in_month):
-                if day <= days:  # check if the day exists in this month
-                    # Calculate the day of the year for the nth day of each month
-                    day_of_year = sum(days_in_month[:month_index]) + day
-                    continuous_day_series.append(day_of_year)
+        # Day of the year for the nth day of each month as a (day, month) grid,
+        # up to 31 days to cover all months; days that don't exist are masked out
+        day = np.arange(1, 32)[:, None]
+        continuous_day_series = (days_before_month + day)[day <= days_in_month]
 
         return continuous_day_series
 
-    # Default column names are those in files as downloaded from https://sam.nrel.gov/weather-data.html
     # Requires an irradiance column (W/m2), temperature column (°C), and wind velocity column (m/s)
     if irradiance_col is None:
-        irradiance_col = "GHI"
+        irradiance_col = default_irradiance_col
     if temperature_col is None:
-        temperature_col = "Tdry"
+        temperature_col = default_temperature_col
     if wind_velocity_col is None:
-        wind_velocity_col = "Wspd"
+        wind_velocity_col = default_wind_velocity_col
 
     continuous_day_series = generate_continuous_day_series()
+    continuous_day_series[continuous_day_series == 365] = 364
+
+    # Collecting hourly weather data as a (day, hour, column) view
+    weather_cols = [irradiance_col, temperature_col, wind_velocity_col]
+    daily_data = (
+        blk.weather_data[weather_cols]
+        .to_numpy(dtype=float)[: days_in_year * hours_per_day]
+        .reshape(days_in_year, hours_per_day, len(weather_cols))
+    )
+    hourly_data = daily_data[continuous_day_series].reshape(-1, len(weather_cols))
 
-    blk.ambient_temp_by_hr = []
-    blk.irradiance_by_hr = []
-    blk.wind_vel_by_hr = []
-
-    # Collecting hourly weather data
-    for day in continuous_day_series:
-        if day == 365:
-            day = 364
-        start_row = day * 24
-        for kk in range(24):
-            irr = float(blk.weather_data[irradiance_col].loc[start_row + kk]) + 10
-            temp = float(blk.weather_data[temperature_col].loc[start_row + kk])
-            wind = float(blk.weather_data[wind_velocity_col].loc[start_row + kk])
-
-            if irr > irradiance_threshold:
-                blk.ambient_temp_by_hr.append(temp)
-                blk.irradiance_by_hr.append(irr)
-                blk.wind_vel_by_hr.append(wind)
-
-            else:
-                blk.ambient_temp_by_hr.append(temp)
-                blk.irradiance_by_hr.append(irr)
-                blk.wind_vel_by_hr.append(wind)
-
-    blk.ambient_temp_by_hr = np.array(blk.ambient_temp_by_hr)
-    blk.irradiance_by_hr = np.array(blk.irradiance_by_hr)
-    blk.wind_vel_by_hr = np.array(blk.wind_vel_by_hr)
+    blk.irradiance_by_hr = hourly_data[:, 0] + 10
+    blk.ambient_temp_by_hr = hourly_data[:, 1]
+    blk.wind_vel_by_hr = hourly_data[:, 2]
 
     return blk.ambient_temp_by_hr, blk.irradiance_by_hr, blk.wind_vel_by_hr
 
@@ -149,10 +152,22 @@ def get_solar_still_daily_water_yield(
     **kwargs,  # kwargs can inlude column name arguments
 ):
     area_bottom_basin = length_basin**2  # Area of square basin (m^2)
+    perimeter_basin = 2 * (2 * length_basin)  # Perimeter of square basin (m)
     blk.initial_salinity = initial_salinity
     blk.initial_water_depth = initial_water_depth
 
-    blk.weather_data = read_csv(input_weather_file_path, skiprows=2)
+    # Only parse the columns used by the calculation. Parsed files are cached
+    # on their path and modification time so repeated builds skip the read.
+    weather_cols = (
+        kwargs.get("irradiance_col") or default_irradiance_col,
+        kwargs.get("temperature_col") or default_temperature_col,
+        kwargs.get("wind_velocity_col") or default_wind_velocity_col,
+    )
+    blk.weather_data = _read_weather_data(
+        input_weather_file_path,
+        os.path.getmtime(input_weather_file_path),
+        weather_cols,
+    ).copy()
 
     if not len(blk.weather_data) >= 8760:
         err_msg = f"Water yield calculation for {blk.name} requires at least "
@@ -178,13 +193,10 @@ def get_solar_still_daily_water_yield(
     blk.volume_scale_formation = np.zeros(len_data_hr * 3600)
     blk.thickness_scale_formation = np.zeros(len_data_hr * 3600)
     blk.evap_sw_mass = np.zeros(len_data_hr * 3600)
-    blk.irradiance = np.zeros(len_data_hr * 3600)
     blk.salt_precipitated = np.zeros(len_data_hr * 3600)
     blk.sw_mass = np.zeros(len_data_hr * 3600)
     blk.fw_mass = np.zeros(len_data_hr * 3600)
     blk.time = np.zeros(len_data_hr * 3600)
-    blk.wind_velocity = np.zeros(len_data_hr * 3600)
-    blk.ambient_temp = np.zeros(len_data_hr * 3600)
     blk.basin_temp = np.zeros(len_data_hr * 3600)
     blk.glass_temp = np.zeros(len_data_hr * 3600)
     blk.sky_temp = np.zeros(len_data_hr * 3600)
@@ -194,64 +206,64 @@ def get_solar_still_daily_water_yield(
     blk.temp_diff_inside_basin = np.zeros(len_data_hr * 3600)
     blk.temp_diff_outside_basin = np.zeros(len_data_hr * 3600)
 
-    # Initializing Temperatures
+    # Converting hourly data into per second
+    blk.irradiance = np.repeat(blk.irradiance_by_hr, 3600)
+    blk.wind_velocity = np.repeat(blk.wind_vel_by_hr, 3600)
+    blk.ambient_temp = np.repeat(blk.ambient_temp_by_hr, 3600)
+
+    # Initializing the first two time steps
     # Initial system is assumed to be in thermal equilibrium with ambient
-    blk.ambient_temp[0] = blk.ambient_temp_by_hr[0]
-    blk.ambient_temp[1] = blk.ambient_temp_by_hr[0]
-
-    # Initial water temperature (°C)
-    blk.saltwater_temp[0] = blk.ambient_temp_by_hr[0]
-    blk.saltwater_temp[1] = blk.ambient_temp_by_hr[0]
-    # Initial basin temperature (°C)
-    blk.basin_temp[0] = blk.ambient_temp_by_hr[0]
-    blk.basin_temp[1] = blk.ambient_temp_by_hr[0]
-    # Initial glass temperature (°C)
-    blk.glass_temp[0] = blk.ambient_temp_by_hr[0]
-    blk.glass_temp[1] = blk.ambient_temp_by_hr[0]
+    # Initial water, basin, and glass temperatures (°C)
+    blk.saltwater_temp[:2] = blk.ambient_temp_by_hr[0]
+    blk.basin_temp[:2] = blk.ambient_temp_by_hr[0]
+    blk.glass_temp[:2] = blk.ambient_temp_by_hr[0]
 
     blk.initial_density = calculate_density(blk.initial_salinity, blk.saltwater_temp[1])
 
-    blk.salt_precipitated[1] = 0
-    blk.salt_precipitated[0] = blk.salt_precipitated[1]
+    blk.salt_precipitated[:2] = 0
 
-    blk.salinity[0] = blk.initial_salinity
-    blk.salinity[1] = blk.initial_salinity
-    blk.excess_salinity[0] = blk.initial_salinity
-    blk.excess_salinity[1] = (
-        blk.initial_salinity
-    )  # Salinity without maximum solublity (g/l)
+    blk.salinity[:2] = blk.initial_salinity
+    # Salinity without maximum solublity (g/l)
+    blk.excess_salinity[:2] = blk.initial_salinity
 
-    blk.depth[0] = blk.initial_water_depth
-    blk.depth[1] = blk.initial_water_depth
+    blk.depth[:2] = blk.initial_water_depth
 
-    blk.sw_mass[0] = blk.depth[0] * blk.initial_density * area_bottom_basin  # kg
-    blk.sw_mass[1] = blk.depth[1] * blk.initial_density * area_bottom_basin  # kg
-    blk.fw_mass[0] = blk.sw_mass[0] / (1 + blk.salinity[0] / 1000)  # kg
-    blk.fw_mass[1] = blk.sw_mass[1] / (1 + blk.salinity[1] / 1000)  # kg
+    # Saltwater and freshwater mass (kg)
+    blk.sw_mass[:2] = blk.initial_water_depth * blk.initial_density * area_bottom_basin
+    blk.fw_mass[:2] = blk.sw_mass[0] / (1 + blk.initial_salinity / 1000)
 
     blk.initial_mass_fw = blk.fw_mass[1]
 
     blk.salt_mass = (
         blk.salinity[1] * blk.fw_mass[1]
     ) / 1000  # Mass of Sodium Chloride (kg)
+    # Salt mass is fixed for the whole cycle; also kept in grams for salinity (g/l)
+    salt_mass = blk.salt_mass
+    salt_mass_g = salt_mass * 1000
 
     # Initial effective radiation temperature of the sky (°C)
     if blk.ambient_temp[0] <= 0:
-        blk.sky_temp[0] = blk.ambient_temp[0]
-        blk.sky_temp[1] = blk.ambient_temp[1]
+        blk.sky_temp[:2] = blk.ambient_temp[0]
     else:
-        blk.sky_temp[0] = 0.0552 * ((blk.ambient_temp[0]) ** 1.5)
-        blk.sky_temp[1] = 0.0552 * ((blk.ambient_temp[1]) ** 1.5)
+        blk.sky_temp[:2] = 0.0552 * ((blk.ambient_temp[0]) ** 1.5)
 
     blk.time[1] = 1
 
-    # Converting hourly data into per second
-    for hour in range(len_data_hr):
-        start_idx = 3600 * hour
-        end_idx = start_idx + 3600
-        blk.irradiance[start_idx:end_idx] = blk.irradiance_by_hr[hour]
-        blk.wind_velocity[start_idx:end_idx] = blk.wind_vel_by_hr[hour]
-        blk.ambient_temp[start_idx:end_idx] = blk.ambient_temp_by_hr[hour]
+    # Weather is constant over each hour, so terms that depend only on it are
+    # evaluated per hour and looked up at each second
+    # Convective heat transfer coefficient to ambient (W/m2°C)
+    conv_heat_trans_coeff_ambient_by_hr = 2.8 + (
+        np.where(blk.wind_vel_by_hr > 5, 3.0, 3.8) * blk.wind_vel_by_hr
+    )
+    # Heat loss coefficient from basin liner to the atmosphere
+    tot_heat_trans_coeff_basin_ambient_by_hr = 1 / (
+        resistance_insulation + (1 / (conv_heat_trans_coeff_ambient_by_hr))
+    )
+    # Effective radiation temperature of the sky (°C); hours at or below 0 °C
+    # stay at 0, as the per-second update never assigned them
+    sky_temp_by_hr = np.array(
+        [0.0552 * (t**1.5) if t > 0 else 0 for t in blk.ambient_temp_by_hr]
+    )
 
     for i in range(2, len(blk.irradiance), 1):
 
@@ -261,45 +273,52 @@ def get_solar_still_daily_water_yield(
             blk.sw_mass[i - 1] = blk.depth[i - 1] * blk.density[0] * area_bottom_basin
             blk.fw_mass[i - 1] = blk.sw_mass[i - 1] / (1 + blk.salinity[i] / 1000)
 
-        blk.time[i] = blk.time[i - 1] + 1
+        blk.time[i] = i
+
+        # Previous time step state and current weather, looked up once per step
+        saltwater_temp_prev = blk.saltwater_temp[i - 1]
+        glass_temp_prev = blk.glass_temp[i - 1]
+        salinity_prev = blk.salinity[i - 1]
+        depth_prev = blk.depth[i - 1]
+        sw_mass_prev = blk.sw_mass[i - 1]
+        fw_mass_prev = blk.fw_mass[i - 1]
+        basin_temp_prev = blk.basin_temp[i - 1]
+        sky_temp_prev = blk.sky_temp[i - 1]
+        ambient_temp_prev = blk.ambient_temp[i - 1]
+        irradiance = blk.irradiance[i]
+        ambient_temp = blk.ambient_temp[i]
+        hour = i // 3600
 
         # Avoiding singularities
-        blk.temp_diff_inside_basin[i] = (
-            blk.saltwater_temp[i - 1] - blk.glass_temp[i - 1]
-        )
-        if blk.temp_diff_inside_basin[i] <= 0:
+        temp_diff_inside_basin = saltwater_temp_prev - glass_temp_prev
+        if temp_diff_inside_basin <= 0:
             # Salwater temp should always be larger that glass temp.
             # When it isn't it is very close and this temp difference should be small.
             # But this quantity must be positive.
-            blk.temp_diff_inside_basin[i] = 0.01
-        blk.temp_diff_outside_basin[i] = blk.glass_temp[i - 1] - blk.ambient_temp[i - 1]
-        if blk.temp_diff_outside_basin[i] <= 0:
+            temp_diff_inside_basin = 0.01
+        temp_diff_outside_basin = glass_temp_prev - ambient_temp_prev
+        if temp_diff_outside_basin <= 0:
             # Glass temp should always be larger that ambient temp.
             # When it isn't it is very close and this temp difference should be small.
             # But this quantity must be positive.
-            blk.temp_diff_outside_basin[i] = 0.01
+            temp_diff_outside_basin = 0.01
+        blk.temp_diff_inside_basin[i] = temp_diff_inside_basin
+        blk.temp_diff_outside_basin[i] = temp_diff_outside_basin
 
         # Effective radiation temperature of the sky
-        if blk.ambient_temp[i] <= 0:
-            blk.sky_temp[i] == blk.ambient_temp[i]
-        else:
-            blk.sky_temp[i] = 0.0552 * ((blk.ambient_temp[i]) ** 1.5)
+        blk.sky_temp[i] = sky_temp_by_hr[hour]
 
         # Perimeter x depth of water (m^2)
-        area_side_water = (2 * (2 * length_basin)) * blk.depth[i - 1]
+        area_side_water = perimeter_basin * depth_prev
 
-        density = calculate_density(blk.salinity[i - 1], blk.saltwater_temp[i - 1])
+        density = calculate_density(salinity_prev, saltwater_temp_prev)
 
-        dynamic_visc = calculate_viscosity(
-            blk.salinity[i - 1], blk.saltwater_temp[i - 1]
-        )
+        dynamic_visc = calculate_viscosity(salinity_prev, saltwater_temp_prev)
 
-        specific_heat = calculate_specific_heat(
-            blk.salinity[i - 1], blk.saltwater_temp[i - 1]
-        )
+        specific_heat = calculate_specific_heat(salinity_prev, saltwater_temp_prev)
 
         thermal_conductivity = calculate_thermal_conductivity(
-            blk.salinity[i - 1], blk.saltwater_temp[i - 1]
+            salinity_prev, saltwater_temp_prev
         )
 
         # Kinemtic viscosity of salt water
@@ -309,50 +328,41 @@ def get_solar_still_daily_water_yield(
         Pr = (specific_heat * dynamic_visc) / thermal_conductivity
 
         # Latent heat of vaporization of pure water J/kg
-        freshwater_vap_latent_heat = (
-            2501.67 - 2.389 * blk.saltwater_temp[i - 1]
-        ) * 1000
+        freshwater_vap_latent_heat = (2501.67 - 2.389 * saltwater_temp_prev) * 1000
 
         # Calculation of partial saturated vapor pressure of saltwater
         # According to parametric analysis and available literature,
         # the partial vapor pressure plays a major role in the evaporation of water.
 
         # A coeff obtained from the water molar fraction in salt solutions from 0-350 g/l Paper: Kokya and Kokya
-        water_activity = (-0.000566 * blk.salinity[i - 1]) + 0.99853070
+        water_activity = (-0.000566 * salinity_prev) + 0.99853070
 
         # Partial saturated vapor pressure at a saltwater temperature (N/m^2)
         sw_partial_vap_press = water_activity * math.exp(
-            25.317 - (5144 / (blk.saltwater_temp[i - 1] + 273))
+            25.317 - (5144 / (saltwater_temp_prev + 273))
         )
 
         # Partial saturated vapor pressure at glass cover temperature (N/m^2)
-        partial_vap_press_at_glass = math.exp(
-            25.317 - (5144 / (blk.glass_temp[i - 1] + 273))
-        )
+        partial_vap_press_at_glass = math.exp(25.317 - (5144 / (glass_temp_prev + 273)))
 
         # Coefficient of volume expansion (1/°C) correlation from Zhutovsky and Kovler (2015)
         beta = 1e-6 * (
-            -0.000006 * blk.saltwater_temp[i - 1] ** 4
-            + 0.001667 * blk.saltwater_temp[i - 1] ** 3
-            - 0.197796 * blk.saltwater_temp[i - 1] ** 2
-            + 16.862446 * blk.saltwater_temp[i - 1]
+            -0.000006 * saltwater_temp_prev**4
+            + 0.001667 * saltwater_temp_prev**3
+            - 0.197796 * saltwater_temp_prev**2
+            + 16.862446 * saltwater_temp_prev
             - 64.319951
         )
 
         # Grashof number
         Gr = abs(
-            (
-                gravity
-                * beta
-                * (blk.basin_temp[i - 1] - blk.saltwater_temp[i - 1])
-                * (blk.depth[i - 1] ** 3)
-            )
+            (gravity * beta * (basin_temp_prev - saltwater_temp_prev) * (depth_prev**3))
             / (kinem_visc_sw**2)
         )
 
         # Heat transfer coeff of water layer
         water_heat_trans_coeff = abs(
-            (thermal_conductivity / blk.depth[i - 1]) * AA * (Gr * Pr) ** BB
+            (thermal_conductivity / depth_prev) * AA * (Gr * Pr) ** BB
         )
 
         # Convective heat transfer coeff (W/m^2.°C) (Dunkel)
@@ -360,11 +370,11 @@ def get_solar_still_daily_water_yield(
             (
                 abs(
                     (
-                        (blk.saltwater_temp[i - 1] - blk.glass_temp[i - 1])
+                        (saltwater_temp_prev - glass_temp_prev)
                         + (
                             (
                                 (sw_partial_vap_press - partial_vap_press_at_glass)
-                                * (blk.saltwater_temp[i - 1] + 273.15)
+                                * (saltwater_temp_prev + 273.15)
                             )
                             / (268900 - sw_partial_vap_press)
                         )
@@ -376,14 +386,10 @@ def get_solar_still_daily_water_yield(
 
         # Radiative heat transfer coeff from basin water to glass cover (W/m^2.°C)
         rad_heat_transf_coeff_water_glass = abs(
-            emissivity_water
-            * stefan_boltzmann
+            rad_coeff_water
             * (
-                (
-                    ((blk.saltwater_temp[i - 1] + 273) ** 2)
-                    + ((blk.glass_temp[i - 1] + 273) ** 2)
-                )
-                * (blk.saltwater_temp[i - 1] + blk.glass_temp[i - 1] + 546)
+                (((saltwater_temp_prev + 273) ** 2) + ((glass_temp_prev + 273) ** 2))
+                * (saltwater_temp_prev + glass_temp_prev + 546)
             )
         )
 
@@ -393,7 +399,7 @@ def get_solar_still_daily_water_yield(
             * conv_heat_trans_coeff_water_glass
             * (
                 (sw_partial_vap_press - partial_vap_press_at_glass)
-                / (blk.temp_diff_inside_basin[i])
+                / (temp_diff_inside_basin)
             )
         )
 
@@ -405,27 +411,13 @@ def get_solar_still_daily_water_yield(
         )
 
         # Radiative heat transfer coeff from glass cover to ambient (W/m^2.°C)
-        rad_heat_trans_coeff_glass_ambient = (
-            stefan_boltzmann
-            * emissivity_glass
-            * (
-                (
-                    ((blk.glass_temp[i - 1] + 273) ** 4)
-                    - ((blk.sky_temp[i - 1] + 273) ** 4)
-                )
-                / (blk.temp_diff_outside_basin[i])
-            )
+        rad_heat_trans_coeff_glass_ambient = rad_coeff_glass * (
+            (((glass_temp_prev + 273) ** 4) - ((sky_temp_prev + 273) ** 4))
+            / (temp_diff_outside_basin)
         )
-        if blk.wind_velocity[i] > 5:
-            # Convective heat transfer coefficient from basin to ambient (W/m2°C)
-            conv_heat_trans_coeff_basin_ambient = 2.8 + (3.0 * blk.wind_velocity[i])
-            # Convective heat transfer coefficient from glass cover to ambient (W/m2°C)
-            conv_heat_trans_coeff_glass_ambient = 2.8 + (3.0 * blk.wind_velocity[i])
-        else:
-            # Convective heat transfer coefficient from basin to ambient (W/m2°C)
-            conv_heat_trans_coeff_basin_ambient = 2.8 + (3.8 * blk.wind_velocity[i])
-            # Convective heat transfer coefficient from glass cover to ambient (W/m2°C)
-            conv_heat_trans_coeff_glass_ambient = 2.8 + (3.8 * blk.wind_velocity[i])
+        # Convective heat transfer coefficients from basin and glass cover to ambient (W/m2°C)
+        conv_heat_trans_coeff_basin_ambient = conv_heat_trans_coeff_ambient_by_hr[hour]
+        conv_heat_trans_coeff_glass_ambient = conv_heat_trans_coeff_basin_ambient
 
         # Total heat loss coeff from the glass cover to the outer atmosphere
         tot_heat_trans_coeff_glass_ambient = (
@@ -433,10 +425,9 @@ def get_solar_still_daily_water_yield(
         )
 
         # Heat loss coefficient from basin liner to the atmosphere
-        tot_heat_trans_coeff_basin_ambient = 1 / (
-            (thickness_insulation / conductivity_insulation)
-            + (1 / (conv_heat_trans_coeff_basin_ambient))
-        )
+        tot_heat_trans_coeff_basin_ambient = tot_heat_trans_coeff_basin_ambient_by_hr[
+            hour
+        ]
 
         # Effective overall absorptivity for energy balance equation
         effective_absorp = (
@@ -467,11 +458,8 @@ def get_solar_still_daily_water_yield(
         # Calculation of overall heat transfer coefficients
         # Overall heat loss coefficient (W/m^2.°C)
         overall_heat_loss_coeff_glass_surr = (
-            (conductivity_glass / thickness_glass)
-            * (tot_heat_trans_coeff_glass_ambient)
-        ) / (
-            (conductivity_glass / thickness_glass) + tot_heat_trans_coeff_glass_ambient
-        )
+            conductance_glass * (tot_heat_trans_coeff_glass_ambient)
+        ) / (conductance_glass + tot_heat_trans_coeff_glass_ambient)
 
         # Overall bottom heat transfer coefficient between the water mass and the surroundings (W/m^2.°C)
         overall_bottom_heat_trans_coeff_water_mass_surr = (
@@ -497,36 +485,39 @@ def get_solar_still_daily_water_yield(
         )
 
         # Present [i] temperature calculation
-        blk.grouping_term[i] = overall_external_heat_trans_loss_coeff / (
-            blk.sw_mass[i - 1] * specific_heat
+        grouping_term = overall_external_heat_trans_loss_coeff / (
+            sw_mass_prev * specific_heat
         )
-        if blk.grouping_term[i] <= 0:
-            blk.grouping_term[i] = blk.grouping_term[i - 1]
+        if grouping_term <= 0:
+            grouping_term = blk.grouping_term[i - 1]
+        blk.grouping_term[i] = grouping_term
 
         time_dependent_term = (
-            (effective_absorp * blk.irradiance[i])
-            + (overall_external_heat_trans_loss_coeff * blk.ambient_temp[i])
-        ) / (blk.sw_mass[i - 1] * specific_heat)
-
-        blk.saltwater_temp[i] = (time_dependent_term / blk.grouping_term[i]) * (
-            1 - np.exp(-blk.grouping_term[i] * blk.time[i])
-        ) + (blk.saltwater_temp[i - 1] * np.exp(-blk.grouping_term[i] * blk.time[i]))
+            (effective_absorp * irradiance)
+            + (overall_external_heat_trans_loss_coeff * ambient_temp)
+        ) / (sw_mass_prev * specific_heat)
+
+        # Elapsed time (s) is the step index
+        decay = np.exp(-grouping_term * i)
+        blk.saltwater_temp[i] = (time_dependent_term / grouping_term) * (1 - decay) + (
+            saltwater_temp_prev * decay
+        )
 
         blk.glass_temp[i] = (
-            (absorp_effective_glass * blk.irradiance[i])
-            + (tot_heat_trans_coeff_water_glass * blk.saltwater_temp[i - 1])
-            + (overall_heat_loss_coeff_glass_surr * blk.ambient_temp[i])
+            (absorp_effective_glass * irradiance)
+            + (tot_heat_trans_coeff_water_glass * saltwater_temp_prev)
+            + (overall_heat_loss_coeff_glass_surr * ambient_temp)
         ) / (tot_heat_trans_coeff_water_glass + overall_heat_loss_coeff_glass_surr)
 
         blk.basin_temp[i] = (
-            (absorp_effective_basin * blk.irradiance[i])
-            + (water_heat_trans_coeff * blk.saltwater_temp[i - 1])
+            (absorp_effective_basin * irradiance)
+            + (water_heat_trans_coeff * saltwater_temp_prev)
             + (
                 (
                     tot_heat_trans_coeff_basin_ambient
                     + conv_heat_trans_coeff_basin_ambient
                 )
-                * blk.basin_temp[i - 1]
+                * basin_temp_prev
             )
         ) / (
             water_heat_trans_coeff
@@ -536,50 +527,59 @@ def get_solar_still_daily_water_yield(
 
         # Evaporation estimation of freshwater and saltwater
         # Distilled (kg)
-        blk.evap_fw_mass[i] = (
+        evap_fw_mass = (
             area_bottom_basin
             * evap_heat_trans_coeff_water_glass
-            * (blk.temp_diff_inside_basin[i])
+            * temp_diff_inside_basin
         ) / freshwater_vap_latent_heat
 
         # Distilled saltwater conversion (Morton) (kg)
-        blk.evap_sw_mass[i] = blk.evap_fw_mass[i] / (1 + blk.salinity[i - 1] / 1e3)
+        evap_sw_mass = evap_fw_mass / (1 + salinity_prev / 1e3)
 
         # Freshwater (kg) this iteration
-        blk.fw_mass[i] = blk.fw_mass[i - 1] - blk.evap_sw_mass[i]
+        fw_mass = fw_mass_prev - evap_sw_mass
         # Saltwater (kg) this iteration
-        blk.sw_mass[i] = blk.fw_mass[i] + blk.salt_mass
+        sw_mass = fw_mass + salt_mass
         # Water depth this iteration
-        blk.depth[i] = blk.sw_mass[i] / (density * area_bottom_basin)
+        depth = sw_mass / (density * area_bottom_basin)
 
-        if blk.salinity[i - 1] >= maximum_solubility:
-            blk.salinity[i] = maximum_solubility
+        blk.evap_fw_mass[i] = evap_fw_mass
+        blk.evap_sw_mass[i] = evap_sw_mass
+        blk.fw_mass[i] = fw_mass
+        blk.sw_mass[i] = sw_mass
+        blk.depth[i] = depth
 
-            # Excess blk.salinity (assuming no saturation possible) (g/l)
-            blk.excess_salinity[i] = (blk.salt_mass * 1000) / blk.fw_mass[i]
+        if salinity_prev >= maximum_solubility:
+            salinity = maximum_solubility
 
-            if blk.excess_salinity[i] < maximum_solubility:
+            # Excess salinity (assuming no saturation possible) (g/l)
+            excess_salinity = salt_mass_g / fw_mass
+
+            if excess_salinity < maximum_solubility:
                 blk.salt_precipitated[i] = 0
                 blk.volume_scale_formation[i] = 0
                 blk.thickness_scale_formation[i] = 0
             else:
                 # Mass precipitated (kg)
-                blk.salt_precipitated[i] = (
-                    blk.fw_mass[i]
-                    * (blk.excess_salinity[i] - maximum_solubility)
-                    / 1000
+                salt_precipitated = (
+                    fw_mass * (excess_salinity - maximum_solubility) / 1000
                 )
                 # Volume of scale formation (m3)
-                blk.volume_scale_formation[i] = blk.salt_precipitated[i] / density_nacl
+                volume_scale_formation = salt_precipitated / density_nacl
+                blk.salt_precipitated[i] = salt_precipitated
+                blk.volume_scale_formation[i] = volume_scale_formation
                 # Thickness of scale formation (m)
                 blk.thickness_scale_formation[i] = (
-                    blk.volume_scale_formation[i] / area_bottom_basin
+                    volume_scale_formation / area_bottom_basin
                 )
 
         else:
-            blk.salinity[i] = (blk.salt_mass * 1000) / blk.fw_mass[i]
-            blk.excess_salinity[i] = blk.salinity[i]
-        if blk.depth[i] <= 0 or blk.fw_mass[i] <= 0:
+            salinity = salt_mass_g / fw_mass
+            excess_salinity = salinity
+        blk.salinity[i] = salinity
+        blk.excess_salinity[i] = excess_salinity
+
+        if depth <= 0 or fw_mass <= 0:
             # At this point either the blk.depth is negative
             # or the amount of freshwater available is negative
             # signaling we have reached the blk.time required for one ZLD cycle for one solar still
@@ -600,4 +600,5 @@ def get_solar_still_daily_water_yield(
     # Daily water yield [kg water per m2 area per day]
     daily_water_yield = annual_water_yield / days_in_year
 
-    return daily_water_yield, num_zld_cycles_per_year
+    # Plain floats so Pyomo Params receive native values rather than NumPy scalars
+    return float(daily_water_yield), float(num_zld_cycles_per_year)